@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+# User fields copied into the tokens at login (see ClaimsTokenObtainPairSerializer),
+# enough for the views and permission checks to run without loading the user.
+USER_CLAIMS = ("username", "email", "role", "is_staff", "is_superuser")
+
+
+def add_user_claims(token, user):
+    for name in USER_CLAIMS:
+        token[name] = getattr(user, name)
+    return token
+
+
+def user_from_claims(user_id, token):
+    """
+    A ``CustomUser`` built from the token (or cached claims) alone, as if
+    loaded from the database with only the claimed fields: it can be
+    assigned to foreign keys, and any other field is fetched on first
+    access like a deferred one.
+    """
+    User = get_user_model()
+    claims = {User._meta.pk.attname: User._meta.pk.to_python(user_id)}
+    claims.update((name, token[name]) for name in USER_CLAIMS)
+    # Only active users are issued tokens.
+    claims["is_active"] = token.get("is_active", True)
+    loaded = [
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.attname in claims
+    ]
+    return User.from_db("default", loaded, [claims[name] for name in loaded])
+
+
+def user_cache_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that takes the user from the token claims instead of
+    loading it on every request. Tokens without the claims (issued before
+    they were added) fall back to a user lookup whose claims, never the
+    whole user, are cached for ``AUTH_USER_CACHE_TIMEOUT`` seconds.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        if all(name in validated_token for name in USER_CLAIMS):
+            return user_from_claims(user_id, validated_token)
+
+        key = user_cache_key(user_id)
+        claims = cache.get(key)
+        if claims is None:
+            user = super().get_user(validated_token)
+            claims = {name: getattr(user, name) for name in (*USER_CLAIMS, "is_active")}
+            cache.set(key, claims, settings.AUTH_USER_CACHE_TIMEOUT)
+            return user
+        if api_settings.CHECK_USER_IS_ACTIVE and not claims["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user_from_claims(user_id, claims)
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    Django's PBKDF2 hasher with the work factor taken from the
+    ``PASSWORD_HASH_ITERATIONS`` setting. The algorithm name is unchanged,
+    so existing hashes still verify and are upgraded to the configured
+    cost on the next successful login.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS
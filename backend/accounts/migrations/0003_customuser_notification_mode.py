@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-18 18:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_customuser_role'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='notification_mode',
+            field=models.CharField(choices=[('immediate', 'One email per notification'), ('digest', 'One summary email per digest interval')], default='immediate', max_length=20),
+        ),
+    ]
@@ -1,5 +1,7 @@
 import uuid
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractUser
 
 
@@ -12,6 +14,30 @@ class CustomUser(AbstractUser):
         ("admin", "Admin"),
     )
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default="seeker")
+    NOTIFICATION_MODE_CHOICES = (
+        ("immediate", "One email per notification"),
+        ("digest", "One summary email per digest interval"),
+    )
+    notification_mode = models.CharField(
+        max_length=20, choices=NOTIFICATION_MODE_CHOICES, default="immediate"
+    )
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Case-insensitive prefix search of the user directory:
+            # istartswith compiles to UPPER(column) LIKE 'PREFIX%', which
+            # needs the pattern opclass outside the C collation.
+            models.Index(
+                OpClass(Upper("username"), name="text_pattern_ops"),
+                name="user_username_prefix_idx",
+            ),
+            models.Index(
+                OpClass(Upper("email"), name="text_pattern_ops"),
+                name="user_email_prefix_idx",
+            ),
+            # Role filter with the directory's keyset ordering.
+            models.Index(fields=["role", "username"], name="user_role_username_idx"),
+        ]
 
     def __str__(self):
         return f"{self.username} ({self.role})"
@@ -0,0 +1,9 @@
+from jobseeker.pagination import KeysetPagination
+
+
+class UserCursorPagination(KeysetPagination):
+    """The user directory in username order, paged by the unique username."""
+
+    ordering = ("username",)
+    page_size = 50
+    max_page_size = 200
@@ -2,7 +2,17 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.validators import validate_email
+from django.db import transaction
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from accounts.authentication import add_user_claims
 from accounts.models import CustomUser
+from notifications.outbox import enqueue_email
+from profiles.models import Profile
 
 User = get_user_model()
 
@@ -18,10 +28,18 @@ class UserSerializer(serializers.ModelSerializer):
             "last_name",
             "phone_number",
             "role",
+            "notification_mode",
         ]
         read_only_fields = ["id", "username", "email", "role"]
 
 
+class UserDirectoryParamsSerializer(serializers.Serializer):
+    """Validates the filters of ``UserListView``."""
+
+    search = serializers.CharField(required=False, max_length=150)
+    role = serializers.ChoiceField(choices=CustomUser.ROLE_CHOICES, required=False)
+
+
 class UserSignupSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, validators=[validate_password])
     password2 = serializers.CharField(write_only=True, required=True)
@@ -48,11 +66,51 @@ class UserSignupSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
+        """
+        Create the user, their profile and the welcome email together: all
+        three are committed, or none. The email is delivered later by the
+        outbox worker.
+        """
         validated_data.pop("password2")
-        user = CustomUser.objects.create_user(
-            username=validated_data["username"],
-            email=validated_data["email"],
-            password=validated_data["password"],
+        user = CustomUser(
+            username=CustomUser.normalize_username(validated_data["username"]),
+            email=CustomUser.objects.normalize_email(validated_data["email"]),
             role=validated_data.get("role", "seeker"),
         )
+        # Hashing is the slow part of signup; do it before the transaction
+        # opens, so no transaction is held while it runs.
+        user.set_password(validated_data["password"])
+        with transaction.atomic():
+            user.save()
+            Profile.objects.create(user=user)
+            enqueue_email(
+                "Welcome to JobSeeker!",
+                f"Hello {user.username},\n\nThank you for joining JobSeeker!",
+                [user.email],
+            )
         return user
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login tokens carrying the user fields read by ``ClaimsJWTAuthentication``."""
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Re-read the user when refreshing, so the new access token carries the
+    current claims (e.g. after a role change) rather than the login's.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        user = User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                self.error_messages["no_active_account"], "no_active_account"
+            )
+        return super().validate({"refresh": str(add_user_claims(refresh, user))})
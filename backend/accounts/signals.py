@@ -0,0 +1,12 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import user_cache_key
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def forget_cached_user(sender, instance, **kwargs):
+    # Drop the copy used by ClaimsJWTAuthentication's fallback lookup.
+    cache.delete(user_cache_key(instance.pk))
@@ -1,9 +1,15 @@
 import pytest
 from django.urls import reverse
 from django.core import mail
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from notifications.models import OutboxMessage
+from notifications.outbox import drain
+from profiles.models import Profile
+from .authentication import user_cache_key
 from .serializers import UserSignupSerializer
 from .permissions import IsRecruiter, IsAdmin
 
@@ -150,14 +156,47 @@ class TestSignupView:
             "password2": "StrongPassword123",
         }
 
-        # We use a context manager to check that one email was sent
         api_client.post(url, data)
 
+        # The email is queued in the outbox and sent by the worker
+        assert len(mail.outbox) == 0
+        assert drain() == 1
         assert len(mail.outbox) == 1
         sent_email = mail.outbox[0]
         assert sent_email.to == ["emailuser@example.com"]
         assert "Welcome to JobSeeker!" in sent_email.subject
 
+    def test_signup_is_all_or_nothing(self, api_client, mocker):
+        mocker.patch.object(
+            Profile.objects, "create", side_effect=RuntimeError("profile failed")
+        )
+        data = {
+            "username": "halfuser",
+            "email": "halfuser@example.com",
+            "password": "StrongPassword123",
+            "password2": "StrongPassword123",
+        }
+
+        with pytest.raises(RuntimeError):
+            api_client.post(reverse("signup"), data)
+
+        assert not User.objects.filter(username="halfuser").exists()
+        assert not OutboxMessage.objects.exists()
+
+    def test_signup_hashes_with_configured_cost(self, api_client, settings):
+        settings.PASSWORD_HASH_ITERATIONS = 1000
+        data = {
+            "username": "cheapuser",
+            "email": "cheapuser@example.com",
+            "password": "StrongPassword123",
+            "password2": "StrongPassword123",
+        }
+        api_client.post(reverse("signup"), data)
+
+        user = User.objects.get(username="cheapuser")
+        assert user.password.startswith("pbkdf2_sha256$1000$")
+        assert user.check_password("StrongPassword123")
+
     def test_signup_with_invalid_data(self, api_client):
         """
         Ensure signup fails with invalid data (e.g., short username).
@@ -186,7 +225,44 @@ class TestUserViews:
         api_client.force_authenticate(user=seeker_user)
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data["results"]) >= 1
+
+    def test_user_directory_search_role_and_pages(
+        self, api_client, seeker_user, recruiter_user, admin_user
+    ):
+        for name in ["Anna", "anton", "bob"]:
+            User.objects.create_user(
+                username=name, email=f"{name.lower()}@corp.example", password="x"
+            )
+        User.objects.create_user(username="zed", email="ANdy@example.com", password="x")
+        api_client.force_authenticate(user=seeker_user)
+        url = reverse("user-list")
+
+        response = api_client.get(url, {"search": "an", "page_size": 2})
+        assert [user["username"] for user in response.data["results"]] == [
+            "Anna",
+            "anton",
+        ]
+        response = api_client.get(response.data["next"])
+        assert [user["username"] for user in response.data["results"]] == ["zed"]
+        assert response.data["next"] is None
+
+        response = api_client.get(url, {"role": "recruiter"})
+        assert [user["id"] for user in response.data["results"]] == [
+            str(recruiter_user.id)
+        ]
+        response = api_client.get(url, {"role": "owner"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_user_directory_pages_are_cached(self, api_client, seeker_user):
+        api_client.force_authenticate(user=seeker_user)
+        url = reverse("user-list")
+        first = api_client.get(url)
+        User.objects.create_user(username="latecomer", password="x")
+        assert api_client.get(url).data == first.data
+
+        api_client.force_authenticate(user=None)
+        assert api_client.get(url).status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_user_detail_view(self, api_client, seeker_user, recruiter_user):
         """Ensure authenticated users can view a specific user's details."""
@@ -196,6 +272,117 @@ class TestUserViews:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["username"] == recruiter_user.username
 
+    def test_switch_to_digest_notifications(self, api_client, recruiter_user):
+        url = reverse("user-me")
+        api_client.force_authenticate(user=recruiter_user)
+        response = api_client.patch(
+            url, {"notification_mode": "digest", "role": "admin"}, format="json"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        recruiter_user.refresh_from_db()
+        assert recruiter_user.notification_mode == "digest"
+        assert recruiter_user.role == "recruiter"
+
+
+# --- Token Authentication ---
+
+
+class TestClaimsTokenAuthentication:
+    def obtain(self, api_client, username):
+        response = api_client.post(
+            reverse("token_obtain_pair"),
+            {"username": username, "password": "password123"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.data
+
+    def test_claims_replace_the_user_query(
+        self, api_client, recruiter_user, django_assert_num_queries
+    ):
+        tokens = self.obtain(api_client, recruiter_user.username)
+        assert AccessToken(tokens["access"])["role"] == "recruiter"
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        url = reverse("user-detail", kwargs={"pk": recruiter_user.pk})
+
+        # Only the user being viewed is read; the requester comes from claims.
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_token_without_claims_uses_cached_lookup(
+        self, api_client, seeker_user, django_assert_num_queries
+    ):
+        token = RefreshToken.for_user(seeker_user).access_token
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        url = reverse("user-detail", kwargs={"pk": seeker_user.pk})
+
+        with django_assert_num_queries(2):
+            api_client.get(url)
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        # Only the claims are cached, not the password hash.
+        assert cache.get(user_cache_key(seeker_user.pk)) == {
+            "username": seeker_user.username,
+            "email": seeker_user.email,
+            "role": "seeker",
+            "is_staff": False,
+            "is_superuser": False,
+            "is_active": True,
+        }
+
+        seeker_user.is_active = False
+        seeker_user.save()
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_refresh_reissues_current_claims(self, api_client, seeker_user):
+        tokens = self.obtain(api_client, seeker_user.username)
+        seeker_user.role = "recruiter"
+        seeker_user.save()
+
+        response = api_client.post(
+            reverse("token_refresh"), {"refresh": tokens["refresh"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert AccessToken(response.data["access"])["role"] == "recruiter"
+
+    def test_login_is_rate_limited_per_ip(
+        self, api_client, seeker_user, settings, mocker
+    ):
+        settings.THROTTLE_RATES = {"token": "20/min"}
+        script = mocker.patch("jobseeker.throttling.token_bucket_script").return_value
+        script.return_value = [0, 30000]
+
+        response = api_client.post(
+            reverse("token_obtain_pair"),
+            {"username": seeker_user.username, "password": "password123"},
+            REMOTE_ADDR="203.0.113.7",
+        )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response["Retry-After"] == "30"
+        assert script.call_args.kwargs["keys"] == ["throttle:token:ip:203.0.113.7"]
+
+    def test_spoofed_forwarded_for_does_not_change_the_bucket(
+        self, api_client, seeker_user, settings, mocker
+    ):
+        settings.THROTTLE_RATES = {"token": "20/min"}
+        script = mocker.patch("jobseeker.throttling.token_bucket_script").return_value
+        script.return_value = [0, 30000]
+
+        for forwarded_for in ("198.51.100.1", "198.51.100.2, 203.0.113.7"):
+            api_client.post(
+                reverse("token_obtain_pair"),
+                {"username": seeker_user.username, "password": "password123"},
+                REMOTE_ADDR="203.0.113.7",
+                HTTP_X_FORWARDED_FOR=forwarded_for,
+            )
+            assert script.call_args.kwargs["keys"] == [
+                "throttle:token:ip:203.0.113.7"
+            ]
+
 
 # --- Permission Tests ---
 
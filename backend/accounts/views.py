@@ -1,21 +1,50 @@
-from rest_framework import generics, status
-from rest_framework.response import Response
-from django.contrib.auth import get_user_model
-from .serializers import UserSerializer, UserSignupSerializer
-from profiles.models import Profile
-from django.core.mail import send_mail
+from rest_framework import generics
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from .pagination import UserCursorPagination
+from .serializers import (
+    UserDirectoryParamsSerializer,
+    UserSerializer,
+    UserSignupSerializer,
+)
+from jobseeker.idempotency import IdempotentPostMixin
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework_simplejwt.views import TokenObtainPairView
 
 
 User = get_user_model()
 
 
+# Decorating ``get`` rather than ``dispatch`` keeps authentication and
+# permission checks in front of the cache.
+@method_decorator(cache_page(settings.USER_DIRECTORY_CACHE_TIMEOUT), name="get")
 class UserListView(generics.ListAPIView):
-    queryset = User.objects.all()
+    """
+    The user directory, by username, with ``?search=`` matching a prefix of
+    the username or email (case-insensitive) and a ``?role=`` filter.
+    Pages are cached briefly, since every user sees the same directory.
+    """
+
     serializer_class = UserSerializer
+    pagination_class = UserCursorPagination
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        params = UserDirectoryParamsSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = User.objects.all()
+        if "search" in params.validated_data:
+            prefix = params.validated_data["search"]
+            queryset = queryset.filter(
+                Q(username__istartswith=prefix) | Q(email__istartswith=prefix)
+            )
+        if "role" in params.validated_data:
+            queryset = queryset.filter(role=params.validated_data["role"])
+        return queryset.only(*UserSerializer.Meta.fields)
+
 
 class UserDetailView(generics.RetrieveAPIView):
     queryset = User.objects.all()
@@ -23,26 +52,26 @@ class UserDetailView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
 
 
-class SignupView(generics.CreateAPIView):
-    serializer_class = UserSignupSerializer
-    permission_classes = [AllowAny]
+class MeView(generics.RetrieveUpdateAPIView):
+    """The requesting user's account, e.g. to switch ``notification_mode``."""
 
-    def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        user = serializer.save()
+    serializer_class = UserSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_object(self):
+        # request.user is built from the token claims; edit the stored row.
+        return User.objects.get(pk=self.request.user.pk)
 
-        Profile.objects.create(user=user)
 
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+class SignupView(IdempotentPostMixin, generics.CreateAPIView):
+    serializer_class = UserSignupSerializer
+    permission_classes = [AllowAny]
+    throttle_scope = "signup"
+    throttle_key = "ip"
+
 
-    def perform_create(self, serializer):
-        user = serializer.save()
+class TokenObtainView(TokenObtainPairView):
+    """Login, rate limited per client IP against credential stuffing."""
 
-        send_mail(
-            "Welcome to JobSeeker!",
-            f"Hello {user.username},\n\nThank you for joining JobSeeker!",
-            settings.DEFAULT_FROM_EMAIL,
-            [user.email],
-            fail_silently=False,
-        )
+    throttle_scope = "token"
+    throttle_key = "ip"
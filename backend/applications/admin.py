@@ -7,3 +7,4 @@ class ApplicationAdmin(admin.ModelAdmin):
     list_display = ["job", "applicant", "status"]
     search_fields = ["job__title", "applicant__username"]
     list_filter = ["status"]
+    list_select_related = ["job", "applicant"]
@@ -0,0 +1,95 @@
+from collections import Counter
+
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from jobs.models import Job
+from .models import STATUS_CHOICES, Application
+
+TOTAL_FIELD = "applications_count"
+
+
+def status_field(status):
+    return f"{status}_count"
+
+
+COUNTER_FIELDS = [TOTAL_FIELD, *(status_field(status) for status, _ in STATUS_CHOICES)]
+
+
+def adjust_counts(job_id, deltas):
+    """
+    Apply ``{field: delta}`` to the counters of a job in one UPDATE. The
+    F() expressions make concurrent adjustments add up instead of
+    overwriting each other.
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    # Clamped at zero: a counter that drifted (e.g. rows deleted with a
+    # raw queryset) must not break the write; reconciling repairs it.
+    Job.objects.filter(pk=job_id).update(
+        **{field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()}
+    )
+
+
+def application_added(job_id, status):
+    adjust_counts(job_id, {TOTAL_FIELD: 1, status_field(status): 1})
+
+
+def application_removed(job_id, status):
+    adjust_counts(job_id, {TOTAL_FIELD: -1, status_field(status): -1})
+
+
+def status_changed(job_id, old_status, new_status, count=1):
+    if old_status != new_status:
+        adjust_counts(
+            job_id, {status_field(old_status): -count, status_field(new_status): count}
+        )
+
+
+def statuses_changed(transitions, new_status):
+    """
+    Counters for a bulk status change: ``transitions`` holds one
+    ``(job_id, old_status)`` pair per moved application. One UPDATE per
+    job and previous status.
+    """
+    for (job_id, old_status), count in Counter(transitions).items():
+        status_changed(job_id, old_status, new_status, count)
+
+
+def counted(**filters):
+    """The number of a job's applications matching ``filters``, as a subquery."""
+    counts = (
+        Application.objects.filter(job=OuterRef("pk"), **filters)
+        .order_by()
+        .values("job")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def actual_counts():
+    """Counter field -> expression counting the applications themselves."""
+    return {
+        TOTAL_FIELD: counted(),
+        **{
+            status_field(status): counted(status=status)
+            for status, _ in STATUS_CHOICES
+        },
+    }
+
+
+def reconcile(jobs=None):
+    """
+    Recount the applications of ``jobs`` (default: every job) and fix the
+    counters that drifted; return the number of jobs fixed. Only drifted
+    rows are written.
+    """
+    jobs = Job.objects.all() if jobs is None else jobs
+    actual = {f"actual_{field}": expr for field, expr in actual_counts().items()}
+    drifted = Q()
+    for field in COUNTER_FIELDS:
+        drifted |= ~Q(**{field: F(f"actual_{field}")})
+    drifted_ids = jobs.annotate(**actual).filter(drifted).values_list("pk", flat=True)
+    return Job.objects.filter(pk__in=list(drifted_ids)).update(**actual_counts())
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from applications.counters import reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount every job's applications and repair the denormalized "
+        "counters that drifted, e.g. after rows were changed in bulk "
+        "outside the ORM signals."
+    )
+
+    def handle(self, *args, **options):
+        fixed = reconcile()
+        self.stdout.write(self.style.SUCCESS(f"Fixed the counters of {fixed} jobs."))
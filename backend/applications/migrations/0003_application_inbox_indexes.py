@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-18 18:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_alter_application_unique_together'),
+        ('jobs', '0005_job_posted_by_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'status', '-applied_at', '-id'], name='application_job_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', '-applied_at', '-id'], name='application_job_applied_idx'),
+        ),
+    ]
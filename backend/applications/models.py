@@ -3,22 +3,20 @@ from django.db import models
 from django.conf import settings
 from jobs.models import Job
 
+STATUS_CHOICES = [
+    ("applied", "Applied"),
+    ("viewed", "Viewed"),
+    ("rejected", "Rejected"),
+    ("accepted", "Accepted"),
+]
+
 
 class Application(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     job = models.ForeignKey(Job, on_delete=models.CASCADE)
     applicant = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     cover_letter = models.TextField(blank=True)
-    status = models.CharField(
-        max_length=50,
-        choices=[
-            ("applied", "Applied"),
-            ("viewed", "Viewed"),
-            ("rejected", "Rejected"),
-            ("accepted", "Accepted"),
-        ],
-        default="applied",
-    )
+    status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="applied")
     applied_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -26,3 +24,15 @@ class Application(models.Model):
 
     class Meta:
         unique_together = ("job", "applicant")
+        indexes = [
+            # Recruiter inbox: one job's applicants, optionally by status,
+            # newest first (the trailing id keeps the keyset unique).
+            models.Index(
+                fields=["job", "status", "-applied_at", "-id"],
+                name="application_job_status_idx",
+            ),
+            models.Index(
+                fields=["job", "-applied_at", "-id"],
+                name="application_job_applied_idx",
+            ),
+        ]
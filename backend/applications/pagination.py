@@ -0,0 +1,9 @@
+from jobseeker.pagination import KeysetPagination
+
+
+class ApplicationCursorPagination(KeysetPagination):
+    """Most recent applications first, paged by ``(applied_at, id)``."""
+
+    ordering = ("-applied_at", "-id")
+    page_size = 50
+    max_page_size = 200
@@ -1,14 +1,38 @@
+from django.contrib.auth import get_user_model
+from django.db import models
 from rest_framework import serializers
-from .models import Application
+from .models import STATUS_CHOICES, Application
+from jobs.fragments import get_fragments
 from jobs.models import Job
 from jobs.serializers import JobSerializer
 
 
+class ApplicationListSerializer(serializers.ListSerializer):
+    """Fetches the fragments of all nested jobs with one cache round-trip."""
+
+    def to_representation(self, data):
+        applications = list(
+            data.all() if isinstance(data, models.manager.BaseManager) else data
+        )
+        job_field = self.child.fields["job"]
+        jobs = [application.job for application in applications]
+        fragments = get_fragments(
+            jobs, job_field.serialize, job_field.requested_fields
+        )
+        job_field.preloaded = {
+            job.pk: fragment for job, fragment in zip(jobs, fragments)
+        }
+        return super().to_representation(applications)
+
+
 class ApplicationSerializer(serializers.ModelSerializer):
     applicant = serializers.HiddenField(default=serializers.CurrentUserDefault())
     job = JobSerializer(read_only=True)
+    # The poster is loaded with the job: creating an application notifies them.
     job_id = serializers.PrimaryKeyRelatedField(
-        queryset=Job.objects.all(), write_only=True, source="job"
+        queryset=Job.objects.select_related("posted_by"),
+        write_only=True,
+        source="job",
     )
 
     class Meta:
@@ -23,10 +47,55 @@ class ApplicationSerializer(serializers.ModelSerializer):
             "cover_letter",
         ]
         read_only_fields = ["id", "applicant", "applied_at", "job"]
+        list_serializer_class = ApplicationListSerializer
+        # Duplicates are caught by the unique constraint on INSERT (see
+        # ApplicationListCreateView), not by an extra SELECT beforehand.
+        validators = []
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # Sparse fieldset of the nested job, see NestedJobFieldsMixin.
+        fields["job"] = JobSerializer(
+            read_only=True, fields=self.context.get("job_fields")
+        )
+        return fields
+
+
+class ApplicantSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = get_user_model()
+        fields = ["id", "username", "email"]
+
+
+class InboxApplicationSerializer(serializers.ModelSerializer):
+    """An application as seen by the recruiter who posted the job."""
+
+    applicant = ApplicantSerializer(read_only=True)
+    job_title = serializers.CharField(source="job.title", read_only=True)
+
+    class Meta:
+        model = Application
+        fields = [
+            "id",
+            "job",
+            "job_title",
+            "applicant",
+            "status",
+            "applied_at",
+            "cover_letter",
+        ]
+        read_only_fields = fields
+
+
+class InboxParamsSerializer(serializers.Serializer):
+    """Validates the filters of ``ApplicationInboxView``."""
 
-    def validate(self, attrs):
-        job = attrs["job"]
-        applicant = self.context["request"].user
-        if Application.objects.filter(job=job, applicant=applicant).exists():
-            raise serializers.ValidationError("You have already applied to this job.")
-        return attrs
+    job = serializers.UUIDField(required=False)
+    status = serializers.ChoiceField(choices=STATUS_CHOICES, required=False)
+
+
+class BulkStatusSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), min_length=1, max_length=5000
+    )
+    status = serializers.ChoiceField(choices=STATUS_CHOICES)
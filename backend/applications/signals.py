@@ -0,0 +1,34 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from jobs.models import Job
+from . import counters
+from .models import Application
+
+
+@receiver(post_init, sender=Application)
+def remember_status(sender, instance, **kwargs):
+    # The status as loaded, to tell status changes apart on save. Read
+    # from __dict__ so a deferred status is not fetched for every row.
+    instance._saved_status = instance.__dict__.get("status")
+
+
+@receiver(post_save, sender=Application)
+def count_saved_application(sender, instance, created, **kwargs):
+    if created:
+        counters.application_added(instance.job_id, instance.status)
+    elif instance._saved_status is not None:
+        counters.status_changed(
+            instance.job_id, instance._saved_status, instance.status
+        )
+    instance._saved_status = instance.status
+
+
+@receiver(post_delete, sender=Application)
+def count_deleted_application(sender, instance, origin=None, **kwargs):
+    # Nothing to count when the job itself is being deleted.
+    if isinstance(origin, Job) or getattr(origin, "model", None) is Job:
+        return
+    counters.application_removed(
+        instance.job_id, instance._saved_status or instance.status
+    )
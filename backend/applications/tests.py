@@ -1,10 +1,20 @@
+import io
+import json
+
 import pytest
 from django.urls import reverse
 from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from jobs.models import Job
+from jobs.serializers import JobSerializer
+from notifications.models import DigestItem, OutboxMessage
+from notifications.outbox import drain
+from .counters import COUNTER_FIELDS, reconcile
 from .models import Application
 
 pytestmark = pytest.mark.django_db
@@ -96,12 +106,33 @@ class TestApplicationListCreateView:
         assert response.data["status"] == "applied"
         assert response.data["job"]["title"] == test_job.title
 
-        # Check that the email was sent to the recruiter
+        # The email is queued in the outbox and sent by the worker
+        assert len(mail.outbox) == 0
+        assert drain() == 1
         assert len(mail.outbox) == 1
         sent_email = mail.outbox[0]
         assert sent_email.to == [recruiter_user.email]
         assert "New Job Application Received" in sent_email.subject
 
+    def test_recruiter_in_digest_mode_gets_no_immediate_email(
+        self, api_client, applicant_user, test_job, recruiter_user
+    ):
+        recruiter_user.notification_mode = "digest"
+        recruiter_user.save()
+        api_client.force_authenticate(user=applicant_user)
+
+        response = api_client.post(
+            reverse("application-list-create"),
+            {"job_id": str(test_job.id)},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert not OutboxMessage.objects.exists()
+        item = DigestItem.objects.get()
+        assert item.recipient == recruiter_user
+        assert applicant_user.username in item.message
+
     def test_create_application_unauthenticated(self, api_client, test_job):
         """Ensure unauthenticated users cannot apply."""
         url = reverse("application-list-create")
@@ -124,6 +155,23 @@ class TestApplicationListCreateView:
         assert response2.status_code == status.HTTP_400_BAD_REQUEST
         assert "already applied" in response2.data[0]
 
+    def test_other_integrity_errors_are_not_reported_as_duplicates(
+        self, api_client, applicant_user, test_job, mocker
+    ):
+        """Only the (job, applicant) unique violation means "already applied"."""
+        from django.db import IntegrityError
+
+        mocker.patch("applications.views.notify", side_effect=IntegrityError)
+        api_client.force_authenticate(user=applicant_user)
+
+        with pytest.raises(IntegrityError):
+            api_client.post(
+                reverse("application-list-create"),
+                {"job_id": str(test_job.id)},
+                format="json",
+            )
+        assert not Application.objects.exists()
+
     def test_list_only_my_applications(
         self, api_client, applicant_user, recruiter_user, test_job
     ):
@@ -142,6 +190,96 @@ class TestApplicationListCreateView:
         assert len(response.data) == 1
         assert response.data[0]["applicant"]["username"] == applicant_user.username
 
+    def test_retry_with_idempotency_key_replays_response(
+        self, api_client, applicant_user, test_job
+    ):
+        """A retried apply returns the first response instead of a 400."""
+        api_client.force_authenticate(user=applicant_user)
+        url = reverse("application-list-create")
+        data = {"job_id": str(test_job.id)}
+
+        first = api_client.post(url, data, format="json", HTTP_IDEMPOTENCY_KEY="k1")
+        retry = api_client.post(url, data, format="json", HTTP_IDEMPOTENCY_KEY="k1")
+
+        assert first.status_code == retry.status_code == status.HTTP_201_CREATED
+        assert retry.data == first.data
+        assert retry["Idempotent-Replayed"] == "true"
+        assert Application.objects.count() == 1
+        assert OutboxMessage.objects.count() == 1
+
+        other = api_client.post(
+            url,
+            {"job_id": str(test_job.id), "cover_letter": "Hi"},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="k1",
+        )
+        assert other.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_list_nests_cached_job_fragments(
+        self, api_client, applicant_user, test_job, mocker
+    ):
+        """Nested jobs come from the job fragment cache shared with /jobs/."""
+        Application.objects.create(job=test_job, applicant=applicant_user)
+        api_client.force_authenticate(user=applicant_user)
+        api_client.get(reverse("job-list-create"))
+
+        serialize = mocker.spy(JobSerializer, "serialize")
+        response = api_client.get(reverse("application-list-create"))
+
+        assert response.data[0]["job"]["title"] == test_job.title
+        serialize.assert_not_called()
+
+    def test_list_with_sparse_job_fields(self, api_client, applicant_user, test_job):
+        Application.objects.create(job=test_job, applicant=applicant_user)
+        api_client.force_authenticate(user=applicant_user)
+
+        response = api_client.get(
+            reverse("application-list-create"), {"job_fields": "id,title"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[0]["job"] == {
+            "id": str(test_job.id),
+            "title": test_job.title,
+        }
+        assert response.data[0]["status"] == "applied"
+
+    def test_list_runs_one_query_however_many_applications(
+        self, api_client, applicant_user, recruiter_user, django_assert_num_queries
+    ):
+        """Jobs are joined in, so the list never issues a query per row."""
+        for number in range(5):
+            job = Job.objects.create(
+                title=f"Job {number}",
+                description="d",
+                location="l",
+                posted_by=recruiter_user,
+            )
+            Application.objects.create(job=job, applicant=applicant_user)
+        api_client.force_authenticate(user=applicant_user)
+
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse("application-list-create"))
+
+        assert len(response.data) == 5
+
+    def test_create_loads_job_and_poster_in_one_query(
+        self, api_client, applicant_user, test_job
+    ):
+        api_client.force_authenticate(user=applicant_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(
+                reverse("application-list-create"),
+                {"job_id": str(test_job.id)},
+                format="json",
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert not [
+            query
+            for query in queries
+            if 'FROM "accounts_customuser"' in query["sql"]
+        ]
+
 
 # --- View Tests: Retrieve, Update, Destroy ---
 
@@ -162,6 +300,15 @@ class TestApplicationDetailView:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["id"] == str(user_application.id)
 
+    def test_retrieve_runs_one_query(
+        self, api_client, applicant_user, user_application, django_assert_num_queries
+    ):
+        api_client.force_authenticate(user=applicant_user)
+        url = reverse("application-detail", kwargs={"pk": user_application.pk})
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+        assert response.data["job"]["id"] == str(user_application.job_id)
+
     def test_delete_own_application(self, api_client, applicant_user, user_application):
         """Ensure a user can delete (withdraw) their own application."""
         api_client.force_authenticate(user=applicant_user)
@@ -200,3 +347,271 @@ class TestApplicationDetailView:
             status.HTTP_403_FORBIDDEN,
             status.HTTP_404_NOT_FOUND,
         ]
+
+
+# --- Export ---
+
+
+def test_export_applications_as_ndjson(api_client, applicant_user, test_job):
+    admin = User.objects.create_user(
+        username="admin", password="password123", role="admin"
+    )
+    application = Application.objects.create(job=test_job, applicant=applicant_user)
+    api_client.force_authenticate(user=admin)
+
+    response = api_client.get(reverse("application-export"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows = [
+        json.loads(line)
+        for line in b"".join(response.streaming_content).decode().splitlines()
+    ]
+    assert rows == [
+        {
+            "id": str(application.id),
+            "job_id": str(test_job.id),
+            "applicant_id": str(applicant_user.id),
+            "status": "applied",
+            "applied_at": application.applied_at.isoformat(),
+            "cover_letter": "",
+        }
+    ]
+
+
+def test_export_applications_requires_admin(api_client, applicant_user):
+    api_client.force_authenticate(user=applicant_user)
+    response = api_client.get(reverse("application-export"))
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# --- Recruiter inbox ---
+
+
+class TestApplicationInboxView:
+    @pytest.fixture
+    def applications(self, recruiter_user, test_job):
+        other_job = Job.objects.create(
+            title="Designer", description="d", location="l", posted_by=recruiter_user
+        )
+        applications = []
+        for number in range(4):
+            seeker = User.objects.create_user(
+                username=f"seeker{number}",
+                email=f"seeker{number}@example.com",
+                password="password123",
+            )
+            applications.append(
+                Application.objects.create(
+                    job=test_job if number % 2 else other_job,
+                    applicant=seeker,
+                    status="viewed" if number == 3 else "applied",
+                )
+            )
+        return applications
+
+    def test_lists_applicants_to_own_jobs_newest_first(
+        self,
+        api_client,
+        recruiter_user,
+        applicant_user,
+        applications,
+        django_assert_num_queries,
+    ):
+        # An application to someone else's job stays out of the inbox.
+        other_recruiter = User.objects.create_user(
+            username="other", password="password123", role="recruiter"
+        )
+        Application.objects.create(
+            job=Job.objects.create(
+                title="Elsewhere",
+                description="d",
+                location="l",
+                posted_by=other_recruiter,
+            ),
+            applicant=applicant_user,
+        )
+        api_client.force_authenticate(user=recruiter_user)
+
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse("application-inbox"), {"page_size": 3})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["id"] for row in response.data["results"]] == [
+            str(application.id) for application in applications[::-1][:3]
+        ]
+        assert response.data["results"][0]["applicant"]["username"] == "seeker3"
+        next_page = api_client.get(response.data["next"])
+        assert [row["id"] for row in next_page.data["results"]] == [
+            str(applications[0].id)
+        ]
+
+    def test_filters_by_job_and_status(
+        self, api_client, recruiter_user, test_job, applications
+    ):
+        api_client.force_authenticate(user=recruiter_user)
+        url = reverse("application-inbox")
+
+        by_job = api_client.get(url, {"job": str(test_job.id)})
+        assert {row["job"] for row in by_job.data["results"]} == {test_job.id}
+        assert len(by_job.data["results"]) == 2
+
+        viewed = api_client.get(url, {"job": str(test_job.id), "status": "viewed"})
+        assert [row["id"] for row in viewed.data["results"]] == [
+            str(applications[3].id)
+        ]
+
+        assert (
+            api_client.get(url, {"status": "archived"}).status_code
+            == status.HTTP_400_BAD_REQUEST
+        )
+
+    def test_seeker_has_no_inbox(self, api_client, applicant_user):
+        api_client.force_authenticate(user=applicant_user)
+        response = api_client.get(reverse("application-inbox"))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# --- Bulk status changes ---
+
+
+def test_bulk_status_updates_owned_applications(
+    api_client, recruiter_user, applicant_user, test_job, settings
+):
+    settings.APPLICATION_BULK_BATCH_SIZE = 2
+    seekers = [
+        User.objects.create_user(
+            username=f"bulk{number}",
+            email=f"bulk{number}@example.com",
+            password="password123",
+        )
+        for number in range(3)
+    ]
+    owned = [
+        Application.objects.create(job=test_job, applicant=seeker)
+        for seeker in seekers
+    ]
+    already = Application.objects.create(
+        job=test_job, applicant=applicant_user, status="rejected"
+    )
+    other_recruiter = User.objects.create_user(
+        username="other", password="password123", role="recruiter"
+    )
+    foreign = Application.objects.create(
+        job=Job.objects.create(
+            title="Elsewhere",
+            description="d",
+            location="l",
+            posted_by=other_recruiter,
+        ),
+        applicant=applicant_user,
+    )
+    api_client.force_authenticate(user=recruiter_user)
+
+    response = api_client.post(
+        reverse("application-bulk-status"),
+        {
+            "ids": [str(app.id) for app in [*owned, already, foreign]],
+            "status": "rejected",
+        },
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["updated"] == 3
+    assert response.data["unchanged"] == 1
+    assert response.data["not_found"] == [foreign.id]
+    assert set(
+        Application.objects.filter(status="rejected").values_list("id", flat=True)
+    ) == {app.id for app in [*owned, already]}
+    assert Application.objects.get(pk=foreign.pk).status == "applied"
+    test_job.refresh_from_db()
+    assert (test_job.applied_count, test_job.rejected_count) == (0, 4)
+    messages = OutboxMessage.objects.all()
+    assert sorted(message.payload["to"][0] for message in messages) == [
+        "bulk0@example.com",
+        "bulk1@example.com",
+        "bulk2@example.com",
+    ]
+
+
+def test_bulk_status_validates_input(api_client, recruiter_user, applicant_user):
+    api_client.force_authenticate(user=recruiter_user)
+    url = reverse("application-bulk-status")
+    response = api_client.post(url, {"ids": [], "status": "rejected"}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = api_client.post(url, {"ids": ["x"], "status": "gone"}, format="json")
+    assert set(response.data) == {"ids", "status"}
+
+    api_client.force_authenticate(user=applicant_user)
+    response = api_client.post(url, {"ids": [], "status": "rejected"}, format="json")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# --- Application counters ---
+
+
+def counts(job):
+    job.refresh_from_db()
+    return {field: getattr(job, field) for field in COUNTER_FIELDS}
+
+
+def test_counters_follow_create_status_change_and_delete(
+    applicant_user, recruiter_user, test_job
+):
+    app = Application.objects.create(job=test_job, applicant=applicant_user)
+    other = Application.objects.create(
+        job=test_job, applicant=recruiter_user, status="viewed"
+    )
+    assert counts(test_job) == {
+        "applications_count": 2,
+        "applied_count": 1,
+        "viewed_count": 1,
+        "rejected_count": 0,
+        "accepted_count": 0,
+    }
+
+    app.status = "accepted"
+    app.save()
+    app.save()
+    assert counts(test_job)["applied_count"] == 0
+    assert counts(test_job)["accepted_count"] == 1
+
+    Application.objects.get(pk=other.pk).delete()
+    assert counts(test_job) == {
+        "applications_count": 1,
+        "applied_count": 0,
+        "viewed_count": 0,
+        "rejected_count": 0,
+        "accepted_count": 1,
+    }
+
+
+def test_saving_a_job_keeps_its_counters(applicant_user, test_job):
+    stale = Job.objects.get(pk=test_job.pk)
+    Application.objects.create(job=test_job, applicant=applicant_user)
+    stale.title = "Senior Engineer"
+    stale.save()
+    assert counts(test_job)["applications_count"] == 1
+
+
+def test_reconcile_fixes_drifted_counters(applicant_user, recruiter_user, test_job):
+    Application.objects.create(job=test_job, applicant=applicant_user)
+    # Bulk updates bypass the signals.
+    Application.objects.update(status="viewed")
+    Job.objects.filter(pk=test_job.pk).update(accepted_count=5)
+    in_sync = Job.objects.create(
+        title="In Sync", description="d", location="l", posted_by=recruiter_user
+    )
+
+    call_command("reconcile_application_counts", stdout=io.StringIO())
+
+    assert counts(test_job) == {
+        "applications_count": 1,
+        "applied_count": 0,
+        "viewed_count": 1,
+        "rejected_count": 0,
+        "accepted_count": 0,
+    }
+    assert counts(in_sync)["applications_count"] == 0
+    assert reconcile() == 0
@@ -0,0 +1,68 @@
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+
+from notifications.outbox import email_payload, enqueue_many
+from . import counters
+from .models import Application
+
+
+def status_email(application, status):
+    username, email, job_title = application
+    return email_payload(
+        "Your application status changed",
+        f"Hello {username},\n\nYour application for '{job_title}' is now "
+        f"marked as {status}.",
+        [email],
+    )
+
+
+def bulk_set_status(recruiter, ids, status, batch_size=None):
+    """
+    Move the applications ``ids`` to ``status``. The rows are locked and
+    their ownership and current status read with one query; they are
+    updated with one ``UPDATE ... WHERE id IN`` per batch, the job counters
+    with one UPDATE per job and previous status, and the applicants'
+    notifications are queued with one INSERT. Ids that are unknown or
+    belong to other recruiters' jobs are returned as ``not_found`` and
+    left alone.
+    """
+    batch_size = batch_size or settings.APPLICATION_BULK_BATCH_SIZE
+    with transaction.atomic():
+        # Locked until commit, so a concurrent change cannot slip between
+        # the read and the UPDATE and leave the counters or emails based on
+        # a stale status. Locking in id order keeps overlapping bulk
+        # changes from deadlocking.
+        rows = (
+            Application.objects.select_for_update(of=("self",))
+            .filter(id__in=ids, job__posted_by=recruiter)
+            .order_by("pk")
+            .values_list(
+                "id",
+                "job_id",
+                "status",
+                "applicant__username",
+                "applicant__email",
+                "job__title",
+            )
+        )
+        owned = {
+            pk: (job_id, current, (username, email, job_title))
+            for pk, job_id, current, username, email, job_title in rows
+        }
+        changed = [pk for pk, (_, current, _) in owned.items() if current != status]
+
+        pending = iter(changed)
+        while batch := list(islice(pending, batch_size)):
+            Application.objects.filter(id__in=batch).update(status=status)
+        counters.statuses_changed([owned[pk][:2] for pk in changed], status)
+        enqueue_many(
+            "email", [status_email(owned[pk][2], status) for pk in changed]
+        )
+
+    return {
+        "updated": len(changed),
+        "unchanged": len(owned) - len(changed),
+        "not_found": [pk for pk in dict.fromkeys(ids) if pk not in owned],
+    }
@@ -1,5 +1,11 @@
 from django.urls import path
-from .views import ApplicationListCreateView, ApplicationDetailView
+from .views import (
+    ApplicationBulkStatusView,
+    ApplicationDetailView,
+    ApplicationExportView,
+    ApplicationInboxView,
+    ApplicationListCreateView,
+)
 
 urlpatterns = [
     path(
@@ -7,6 +13,21 @@ urlpatterns = [
         ApplicationListCreateView.as_view(),
         name="application-list-create",
     ),
+    path(
+        "applications/export/",
+        ApplicationExportView.as_view(),
+        name="application-export",
+    ),
+    path(
+        "applications/bulk-status/",
+        ApplicationBulkStatusView.as_view(),
+        name="application-bulk-status",
+    ),
+    path(
+        "applications/inbox/",
+        ApplicationInboxView.as_view(),
+        name="application-inbox",
+    ),
     path(
         "applications/<uuid:pk>/",
         ApplicationDetailView.as_view(),
@@ -1,31 +1,87 @@
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, serializers
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from accounts.permissions import IsAdmin, IsRecruiter
+from django.db import IntegrityError, transaction
+from jobs.serializers import job_deferred_fields, parse_job_fields
+from jobseeker.export import StreamingExportView
+from jobseeker.idempotency import IdempotentPostMixin
+from notifications.digests import notify
 from .models import Application
-from .serializers import ApplicationSerializer
-from django.core.mail import send_mail
-from django.conf import settings
+from .pagination import ApplicationCursorPagination
+from .transitions import bulk_set_status
+from .serializers import (
+    ApplicationSerializer,
+    BulkStatusSerializer,
+    InboxApplicationSerializer,
+    InboxParamsSerializer,
+)
 
 
-class ApplicationListCreateView(generics.ListCreateAPIView):
+class NestedJobFieldsMixin:
+    """
+    ``?job_fields=title,location`` on GET renders only those fields of the
+    nested job, and the job columns that are not needed are deferred.
+    """
+
+    def get_job_fields(self):
+        if self.request.method != "GET":
+            return None
+        return parse_job_fields(
+            self.request.query_params.get("job_fields"), param="job_fields"
+        )
+
+    def with_job(self, queryset):
+        deferred = job_deferred_fields(self.get_job_fields())
+        return queryset.select_related("job").defer(
+            *[f"job__{name}" for name in deferred]
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["job_fields"] = self.get_job_fields()
+        return context
+
+
+class ApplicationListCreateView(
+    IdempotentPostMixin, NestedJobFieldsMixin, generics.ListCreateAPIView
+):
     queryset = Application.objects.all()
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def perform_create(self, serializer):
-        application = serializer.save(applicant=self.request.user)
-        job_owner_email = application.job.posted_by.email
-        send_mail(
-            "New Job Application Received",
-            f"Hello,\n\n{self.request.user.username} has applied for your job posting '{application.job.title}'.",
-            settings.DEFAULT_FROM_EMAIL,
-            [job_owner_email],
-            fail_silently=False,
-        )
+        # The notification is committed with the application and sent later
+        # by the outbox worker, or bundled into the recruiter's next digest,
+        # so SMTP never slows down or fails the request.
+        try:
+            with transaction.atomic():
+                application = serializer.save(applicant=self.request.user)
+                notify(
+                    application.job.posted_by,
+                    "New Job Application Received",
+                    f"{self.request.user.username} has applied for your job "
+                    f"posting '{application.job.title}'.",
+                )
+        except IntegrityError:
+            # unique_together (job, applicant): one INSERT instead of a
+            # racy SELECT-then-INSERT. Only that violation is the user's
+            # doing; anything else is a real error.
+            if Application.objects.filter(
+                job=serializer.validated_data["job"], applicant=self.request.user
+            ).exists():
+                raise serializers.ValidationError(
+                    "You have already applied to this job."
+                )
+            raise
 
     def get_queryset(self):
-        return Application.objects.filter(applicant=self.request.user)
+        return self.with_job(Application.objects.filter(applicant=self.request.user))
 
 
-class ApplicationDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ApplicationDetailView(
+    NestedJobFieldsMixin, generics.RetrieveUpdateDestroyAPIView
+):
     queryset = Application.objects.all()
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -34,4 +90,70 @@ class ApplicationDetailView(generics.RetrieveUpdateDestroyAPIView):
         """
         This ensures the user can only see/edit/delete their own applications.
         """
-        return Application.objects.filter(applicant=self.request.user)
+        return self.with_job(Application.objects.filter(applicant=self.request.user))
+
+
+class ApplicationInboxView(generics.ListAPIView):
+    """
+    Applications to the requesting recruiter's jobs, newest first, with
+    ``?job=`` and ``?status=`` filters and cursor pagination.
+    """
+
+    serializer_class = InboxApplicationSerializer
+    pagination_class = ApplicationCursorPagination
+    permission_classes = [IsRecruiter | IsAdmin]
+
+    def get_queryset(self):
+        params = InboxParamsSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = Application.objects.filter(job__posted_by=self.request.user)
+        if "job" in params.validated_data:
+            queryset = queryset.filter(job_id=params.validated_data["job"])
+        if "status" in params.validated_data:
+            queryset = queryset.filter(status=params.validated_data["status"])
+        return queryset.select_related("job", "applicant").only(
+            "id",
+            "job_id",
+            "job__title",
+            "applicant__id",
+            "applicant__username",
+            "applicant__email",
+            "status",
+            "applied_at",
+            "cover_letter",
+        )
+
+
+class ApplicationBulkStatusView(APIView):
+    """
+    Set the status of many applications to the recruiter's jobs at once:
+    ``{"ids": [...], "status": "rejected"}``.
+    """
+
+    permission_classes = [IsRecruiter | IsAdmin]
+
+    def post(self, request):
+        serializer = BulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = bulk_set_status(
+            request.user,
+            serializer.validated_data["ids"],
+            serializer.validated_data["status"],
+        )
+        return Response(result)
+
+
+class ApplicationExportView(StreamingExportView):
+    permission_classes = [IsAdmin]
+    filename = "applications"
+    fields = (
+        "id",
+        "job_id",
+        "applicant_id",
+        "status",
+        "applied_at",
+        "cover_letter",
+    )
+
+    def get_queryset(self):
+        return Application.objects.all()
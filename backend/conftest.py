@@ -0,0 +1,77 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    """
+    Give every test a private in-memory cache, so cached search results
+    and counters never leak between tests or into the Redis used by the
+    running stack.
+    """
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def search_without_fallback(settings):
+    """
+    Search tests mock Elasticsearch; without a fallback configured the
+    backend is used directly instead of being health-checked first.
+    Fallback tests opt back in through the ``settings`` fixture.
+    """
+    settings.SEARCH_FALLBACK_BACKEND = None
+
+
+@pytest.fixture(autouse=True)
+def no_throttling(settings):
+    """
+    Rate limits live in Redis, which tests do not run against. Throttle
+    tests opt back in through the ``settings`` fixture.
+    """
+    settings.THROTTLE_RATES = {}
+
+
+class FakeRedis:
+    """The handful of Redis set/string commands the indexing queue uses."""
+
+    def __init__(self):
+        self.sets = {}
+        self.strings = {}
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(m.encode() for m in members)
+
+    def spop(self, key, count):
+        members = self.sets.get(key, set())
+        popped = [members.pop() for _ in range(min(count, len(members)))]
+        return popped
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    def get(self, key):
+        return self.strings.get(key)
+
+    def delete(self, key):
+        self.strings.pop(key, None)
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(mocker):
+    """
+    Saving an indexed model queues it in Redis on commit and schedules a
+    Celery flush. Give every test an in-memory queue and keep the flush
+    off the broker; queue tests inspect the returned client.
+    """
+    client = FakeRedis()
+    mocker.patch("search.indexing.get_redis_client", return_value=client)
+    mocker.patch("search.tasks.flush_index_queue.apply_async")
+    return client
@@ -13,14 +13,21 @@ class JobDocument(Document):
             "email": fields.TextField(),
         }
     )
+    # Completion subfields back the typeahead; location.raw backs
+    # exact-match location filters.
+    title = fields.TextField(fields={"suggest": fields.CompletionField()})
+    location = fields.TextField(
+        fields={"raw": fields.KeywordField(), "suggest": fields.CompletionField()}
+    )
 
     class Django:
         model = Job
         fields = [
             "id",
-            "title",
             "description",
-            "location",
             "salary",
             "created_at",
         ]
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("posted_by")
@@ -0,0 +1,41 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Bump when the serialized shape of a job changes, to ignore old fragments.
+FRAGMENT_VERSION = 1
+
+
+def fieldset_key(fields):
+    """Short, order-independent name of a sparse fieldset (``None``: all)."""
+    if fields is None:
+        return "all"
+    return hashlib.sha1(",".join(sorted(fields)).encode("utf-8")).hexdigest()[:12]
+
+
+def fragment_key(job, fields=None):
+    version = job.updated_at.timestamp()
+    return (
+        f"jobs:fragment:v{FRAGMENT_VERSION}:{fieldset_key(fields)}:"
+        f"{job.pk}:{version:.6f}"
+    )
+
+
+def get_fragments(jobs, serialize, fields=None):
+    """
+    Serialized ``jobs``, in order. Fragments are cached per job, row version
+    and fieldset, so an edit simply makes the old key unreachable. All jobs
+    are looked up with one ``get_many``; only misses go through
+    ``serialize`` and are stored back with one ``set_many``.
+    """
+    keys = [fragment_key(job, fields) for job in jobs]
+    fragments = cache.get_many(keys)
+    missing = {}
+    for key, job in zip(keys, jobs):
+        if key not in fragments and key not in missing:
+            missing[key] = serialize(job)
+    if missing:
+        cache.set_many(missing, settings.JOB_FRAGMENT_CACHE_TIMEOUT)
+        fragments.update(missing)
+    return [fragments[key] for key in keys]
@@ -0,0 +1,79 @@
+import csv
+import io
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from django_elasticsearch_dsl.apps import DEDConfig
+from rest_framework import serializers
+
+from search.cache import bump_generation
+from search.indexing import enqueue_many
+from .models import Job
+from .search import JOB_INDEX
+from .serializers import JobSerializer
+from .signals import update_search_vectors
+
+
+def read_csv(file):
+    """
+    Rows of a CSV file (binary uploads are read as UTF-8) as dicts keyed by
+    the header line. Empty cells are left out, so optional columns such as
+    ``salary`` may be blank. Raises ``UnicodeDecodeError`` on other encodings.
+    """
+    if not isinstance(file, io.TextIOBase):
+        file = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    return [
+        {name: value for name, value in row.items() if name and value != ""}
+        for row in csv.DictReader(file)
+    ]
+
+
+def validate_rows(rows):
+    """
+    Split ``rows`` into validated data and an error report. Each row goes
+    through the same rules as a single ``JobSerializer`` create; ``row`` in
+    the report is the 1-based position of the row in the upload.
+    """
+    serializer = JobSerializer()
+    valid, errors = [], []
+    for number, row in enumerate(rows, start=1):
+        try:
+            valid.append(serializer.run_validation(row))
+        except serializers.ValidationError as exc:
+            errors.append({"row": number, "errors": exc.detail})
+    return valid, errors
+
+
+def create_jobs(validated_rows, posted_by, batch_size=None):
+    """
+    Insert ``validated_rows`` with one ``bulk_create`` per batch. The search
+    vectors are filled in with one UPDATE per batch, and the new rows are
+    queued for Elasticsearch, which indexes them with ``_bulk`` requests.
+    """
+    batch_size = batch_size or settings.JOB_IMPORT_BATCH_SIZE
+    rows = iter(validated_rows)
+    created = 0
+    while batch := list(islice(rows, batch_size)):
+        with transaction.atomic():
+            jobs = Job.objects.bulk_create(
+                [Job(**data, posted_by=posted_by) for data in batch]
+            )
+            pks = [job.pk for job in jobs]
+            # bulk_create sends no post_save signals, so do their work here.
+            update_search_vectors(Job.objects.filter(pk__in=pks))
+            if DEDConfig.autosync_enabled():
+                transaction.on_commit(lambda pks=pks: enqueue_many(Job, pks))
+            transaction.on_commit(lambda: bump_generation(JOB_INDEX))
+        created += len(jobs)
+    return created
+
+
+def import_jobs(rows, posted_by, batch_size=None):
+    """
+    Validate and create jobs from ``rows``. Invalid rows are skipped and
+    reported; the valid ones are created either way.
+    """
+    valid, errors = validate_rows(rows)
+    created = create_jobs(valid, posted_by, batch_size=batch_size)
+    return {"created": created, "errors": errors}
@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.importing import import_jobs, read_csv
+
+
+class Command(BaseCommand):
+    help = (
+        "Import jobs from a JSON array or a CSV file, validating every row "
+        "like the API does and inserting them in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="JSON or CSV file to import.")
+        parser.add_argument(
+            "--posted-by",
+            required=True,
+            help="Username of the recruiter the jobs are posted by.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["json", "csv"],
+            help="File format (default: guessed from the file extension).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Rows per bulk insert (default: JOB_IMPORT_BATCH_SIZE).",
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            posted_by = User.objects.get(username=options["posted_by"])
+        except User.DoesNotExist:
+            raise CommandError(f"Unknown user: {options['posted_by']}")
+
+        path = Path(options["path"])
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+        if file_format not in ("json", "csv"):
+            raise CommandError("Cannot guess the file format; pass --format.")
+        try:
+            with path.open(encoding="utf-8-sig", newline="") as file:
+                rows = json.load(file) if file_format == "json" else read_csv(file)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read {path}: {exc}")
+        if not isinstance(rows, list):
+            raise CommandError("A JSON import must be an array of jobs.")
+
+        report = import_jobs(rows, posted_by, batch_size=options["batch_size"])
+        for error in report["errors"]:
+            self.stderr.write(f"Row {error['row']}: {json.dumps(error['errors'])}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report['created']} jobs, "
+                f"skipped {len(report['errors'])} invalid rows."
+            )
+        )
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.7 on 2026-10-18 18:43
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_applications(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    Application = apps.get_model("applications", "Application")
+
+    def counted(**filters):
+        counts = (
+            Application.objects.filter(job=OuterRef("pk"), **filters)
+            .order_by()
+            .values("job")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+    Job.objects.update(
+        applications_count=counted(),
+        **{
+            f"{status}_count": counted(status=status)
+            for status in ("applied", "viewed", "rejected", "accepted")
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_posted_by_created_idx'),
+        ('applications', '0003_application_inbox_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='accepted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applications_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applied_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='rejected_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='viewed_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_applications, migrations.RunPython.noop),
+    ]
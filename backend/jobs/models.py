@@ -1,7 +1,18 @@
 import uuid
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.conf import settings
 
+# Maintained with F() updates only (see applications.counters).
+APPLICATION_COUNTER_FIELDS = (
+    "applications_count",
+    "applied_count",
+    "viewed_count",
+    "rejected_count",
+    "accepted_count",
+)
+
 
 class Job(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -11,6 +22,42 @@ class Job(models.Model):
     salary = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     posted_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Row version for ETag / Last-Modified on the detail endpoint.
+    updated_at = models.DateTimeField(auto_now=True)
+    # Weighted title/location/description vector for the Postgres search
+    # backend, refreshed by jobs.signals after every save.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Application counters, kept up to date by applications.counters and
+    # repaired by `manage.py reconcile_application_counts`.
+    applications_count = models.PositiveIntegerField(default=0, editable=False)
+    applied_count = models.PositiveIntegerField(default=0, editable=False)
+    viewed_count = models.PositiveIntegerField(default=0, editable=False)
+    rejected_count = models.PositiveIntegerField(default=0, editable=False)
+    accepted_count = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta:
+        indexes = [
+            # Backs the keyset pagination of the job list.
+            models.Index(fields=["-created_at", "-id"], name="job_created_id_idx"),
+            GinIndex(fields=["search_vector"], name="job_search_vector_idx"),
+            # A recruiter's own postings, newest first (/api/jobs/mine/).
+            models.Index(
+                fields=["posted_by", "-created_at", "-id"],
+                name="job_posted_by_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        # A full save of an existing job would write back the counters as
+        # they were loaded, losing applications counted in the meantime.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            skipped = self.get_deferred_fields().union(APPLICATION_COUNTER_FIELDS)
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in skipped
+            ]
+        super().save(*args, **kwargs)
@@ -0,0 +1,9 @@
+from jobseeker.pagination import KeysetPagination
+
+
+class JobCursorPagination(KeysetPagination):
+    """Newest jobs first, paged by ``(created_at, id)``."""
+
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    max_page_size = 100
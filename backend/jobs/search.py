@@ -0,0 +1,487 @@
+import base64
+import datetime
+import html
+import json
+import uuid
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.core.cache import cache
+from django.db.models import Count, F, FloatField, Q as ModelQ
+from django.db.models.functions import Cast, Floor
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django_elasticsearch_dsl.search import Search
+from elasticsearch_dsl import Q
+from rest_framework import serializers
+
+from jobseeker.pagination import keyset_filter
+from search.backends import ElasticsearchBackend, PostgresBackend
+from search.cache import make_key
+from .models import Job
+
+JOB_INDEX = "jobs"
+SEARCH_FIELDS = ["title", "description", "location"]
+# List results skip the description; a highlighted snippet is shipped instead.
+LIST_SOURCE_FIELDS = ["id", "title", "location", "salary", "created_at"]
+BROWSE_SORT = [{"created_at": {"order": "desc"}}, {"id": {"order": "desc"}}]
+RELEVANCE_SORT = ["_score", *BROWSE_SORT]
+SNIPPET_SIZE = 160
+# Postgres headlines mark matches with these control characters; the text
+# is HTML-escaped before they become <em> tags (see headline_html).
+HEADLINE_START_SEL, HEADLINE_STOP_SEL = "\x02", "\x03"
+# Facets: top locations, salary histogram buckets and posting-date ranges.
+LOCATION_FACET_SIZE = 10
+SALARY_FACET_INTERVAL = 10000
+# Rounded date math keeps the aggregation cacheable by Elasticsearch.
+POSTED_FACET_RANGES = [
+    {"key": "past_day", "from": "now-1d/h"},
+    {"key": "past_week", "from": "now-7d/d"},
+    {"key": "past_month", "from": "now-30d/d"},
+]
+POSTED_FACET_DELTAS = {
+    "past_day": datetime.timedelta(days=1),
+    "past_week": datetime.timedelta(days=7),
+    "past_month": datetime.timedelta(days=30),
+}
+# Facet -> the search params that filter on it. Each facet is counted with
+# every filter but its own applied, so the other values stay selectable.
+FACET_FILTER_PARAMS = {
+    "locations": ("location",),
+    "salary": ("salary_min", "salary_max"),
+    "posted": ("posted_after", "posted_before"),
+}
+# Response key -> completion subfield used for typeahead suggestions.
+SUGGEST_FIELDS = {"titles": "title.suggest", "locations": "location.suggest"}
+SEARCH_CONFIG = "english"
+# Stored in Job.search_vector and kept current by jobs.signals.
+JOB_SEARCH_VECTOR = (
+    SearchVector("title", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("location", weight="B", config=SEARCH_CONFIG)
+    + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+)
+
+
+def encode_search_after(cursor):
+    """Opaque token for a ``{"backend", "values"}`` cursor of a search page."""
+    payload = json.dumps({"b": cursor["backend"], "v": list(cursor["values"])})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_search_after(token):
+    """Return the cursor in ``token``, or raise ``ValueError``."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        backend, values = payload["b"], payload["v"]
+    except (TypeError, ValueError, UnicodeError, KeyError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(backend, str) or not isinstance(values, list) or not values:
+        raise ValueError("Invalid cursor")
+    return {"backend": backend, "values": values}
+
+
+def job_filter_clauses(params):
+    """
+    Filter-context clauses for ``params``. They do not take part in scoring,
+    so Elasticsearch can answer them from its filter cache.
+    """
+    clauses = []
+    if params.get("location"):
+        clauses.append(Q("term", **{"location.raw": params["location"]}))
+
+    salary = {}
+    if params.get("salary_min") is not None:
+        salary["gte"] = float(params["salary_min"])
+    if params.get("salary_max") is not None:
+        salary["lte"] = float(params["salary_max"])
+    if salary:
+        clauses.append(Q("range", salary=salary))
+
+    created_at = {}
+    if params.get("posted_after"):
+        created_at["gte"] = params["posted_after"].isoformat()
+    if params.get("posted_before"):
+        created_at["lte"] = params["posted_before"].isoformat()
+    if created_at:
+        clauses.append(Q("range", created_at=created_at))
+    return clauses
+
+
+def without_facet_filter(params, facet):
+    """``params`` minus the filters on ``facet``."""
+    excluded = FACET_FILTER_PARAMS[facet]
+    return {name: value for name, value in params.items() if name not in excluded}
+
+
+def build_job_search(params, with_facets=False):
+    """
+    Build the job search for validated ``JobSearchParamsSerializer`` data.
+
+    An empty ``q`` becomes a ``match_all`` browse sorted by recency. One hit
+    more than ``page_size`` is requested to tell whether a next page exists.
+    With ``with_facets`` the filters go in ``post_filter``, so they narrow
+    the hits but not the documents the facet aggregations count.
+    """
+    s = Search(index=JOB_INDEX)
+    if params.get("q"):
+        s = s.query("multi_match", query=params["q"], fields=SEARCH_FIELDS)
+        s = s.sort(*RELEVANCE_SORT)
+        s = s.highlight(
+            "description", fragment_size=SNIPPET_SIZE, number_of_fragments=1
+        )
+        # Descriptions are recruiter-supplied: escape them around the <em> tags.
+        s = s.highlight_options(encoder="html")
+    else:
+        s = s.query("match_all")
+        s = s.sort(*BROWSE_SORT)
+
+    clauses = job_filter_clauses(params)
+    if with_facets:
+        if clauses:
+            s = s.post_filter("bool", filter=clauses)
+    else:
+        for clause in clauses:
+            s = s.filter(clause)
+
+    s = s.source(includes=LIST_SOURCE_FIELDS)
+    extra = {"size": params["page_size"] + 1, "track_total_hits": False}
+    if params.get("cursor"):
+        extra["search_after"] = params["cursor"]
+    return s.extra(**extra)
+
+
+def headline_html(headline):
+    """An escaped Postgres headline with its matches wrapped in ``<em>``."""
+    if headline is None:
+        return None
+    return (
+        html.escape(headline)
+        .replace(HEADLINE_START_SEL, "<em>")
+        .replace(HEADLINE_STOP_SEL, "</em>")
+    )
+
+
+def serialize_hit(hit):
+    result = {field: getattr(hit, field, None) for field in LIST_SOURCE_FIELDS}
+    highlight = getattr(hit.meta, "highlight", None)
+    fragments = getattr(highlight, "description", None) if highlight else None
+    result["snippet"] = " … ".join(fragments) if fragments else None
+    return result
+
+
+def add_facet_aggs(s, params):
+    """
+    Add the facet aggregations to ``s`` (in place, like ``Search.aggs``).
+    Each one sits in a ``filter`` aggregation applying the other facets'
+    filters from ``params``; ``s`` itself must not filter on them.
+    """
+
+    def facet(name):
+        clauses = job_filter_clauses(without_facet_filter(params, name))
+        return s.aggs.bucket(name, "filter", filter=Q("bool", filter=clauses))
+
+    facet("locations").bucket(
+        "locations", "terms", field="location.raw", size=LOCATION_FACET_SIZE
+    )
+    facet("salary").bucket(
+        "salary",
+        "histogram",
+        field="salary",
+        interval=SALARY_FACET_INTERVAL,
+        min_doc_count=1,
+    )
+    facet("posted").bucket(
+        "posted", "date_range", field="created_at", ranges=POSTED_FACET_RANGES
+    )
+    return s
+
+
+def parse_facets(aggregations):
+    return {
+        "locations": [
+            {"value": bucket.key, "count": bucket.doc_count}
+            for bucket in aggregations.locations.locations.buckets
+        ],
+        "salary": [
+            {
+                "from": bucket.key,
+                "to": bucket.key + SALARY_FACET_INTERVAL,
+                "count": bucket.doc_count,
+            }
+            for bucket in aggregations.salary.salary.buckets
+        ],
+        "posted": [
+            {"key": bucket.key, "count": bucket.doc_count}
+            for bucket in aggregations.posted.posted.buckets
+        ],
+    }
+
+
+def search_jobs(params, with_facets=False):
+    """
+    Run the search for ``params`` and return a cacheable page: the
+    serialized hits plus the ``search_after`` values of the next page.
+    With ``with_facets`` the facet aggregations ride on the same request.
+    """
+    page_size = params["page_size"]
+    s = build_job_search(params, with_facets=with_facets)
+    if with_facets:
+        add_facet_aggs(s, params)
+    response = s.execute()
+    hits = list(response)
+    next_cursor = None
+    if len(hits) > page_size:
+        hits = hits[:page_size]
+        next_cursor = list(hits[-1].meta.sort)
+    page = {"results": [serialize_hit(hit) for hit in hits], "next": next_cursor}
+    if with_facets:
+        page["facets"] = parse_facets(response.aggregations)
+    return page
+
+
+def facet_jobs(params):
+    """Facets only: a size-0 request for when the hits are already cached."""
+    s = build_job_search(
+        {**params, "page_size": 0, "cursor": None}, with_facets=True
+    ).extra(size=0)
+    return parse_facets(add_facet_aggs(s, params).execute().aggregations)
+
+
+def search_jobs_with_facets(backend, params):
+    """
+    Hits and facets for ``params``. They are cached under separate keys:
+    hits follow the index generation, while facets change slowly and
+    simply expire after ``FACETS_CACHE_TIMEOUT``. Whatever is missing is
+    fetched from ``backend`` in a single request.
+    """
+    facet_params = {
+        name: value
+        for name, value in params.items()
+        if name not in ("cursor", "page_size")
+    }
+    hits_key = make_key(JOB_INDEX, params, prefix=f"results:{backend.name}")
+    facets_key = make_key(
+        JOB_INDEX, facet_params, prefix=f"facets:{backend.name}", versioned=False
+    )
+    cached = cache.get_many([hits_key, facets_key])
+    page, facets = cached.get(hits_key), cached.get(facets_key)
+
+    if page is None:
+        page = backend.search(params, with_facets=facets is None)
+        if facets is None:
+            facets = page.pop("facets")
+            cache.set(facets_key, facets, settings.FACETS_CACHE_TIMEOUT)
+        cache.set(hits_key, page, settings.SEARCH_CACHE_TIMEOUT)
+    elif facets is None:
+        facets = backend.facets(facet_params)
+        cache.set(facets_key, facets, settings.FACETS_CACHE_TIMEOUT)
+    return {**page, "facets": facets}
+
+
+def suggest_jobs(params):
+    """
+    Completion suggestions for job titles and locations in one request.
+    The completion suggester is served from an in-memory FST, and no hits
+    or sources are fetched.
+    """
+    s = Search(index=JOB_INDEX).extra(size=0).source(False)
+    for name, field in SUGGEST_FIELDS.items():
+        s = s.suggest(
+            name,
+            params["q"],
+            completion={
+                "field": field,
+                "size": params["size"],
+                "skip_duplicates": True,
+            },
+        )
+    response = s.execute()
+    return {
+        name: [option.text for option in response.suggest[name][0].options]
+        for name in SUGGEST_FIELDS
+    }
+
+
+class JobElasticsearchBackend(ElasticsearchBackend):
+    def search(self, params, with_facets=False):
+        params = {**params, "cursor": self.cursor_values(params.get("cursor"))}
+        page = search_jobs(params, with_facets=with_facets)
+        return {**page, "next": self.make_cursor(page["next"])}
+
+    def facets(self, params):
+        return facet_jobs(params)
+
+    def suggest(self, params):
+        return suggest_jobs(params)
+
+
+class JobPostgresBackend(PostgresBackend):
+    """
+    Full-text search on the stored ``Job.search_vector`` column (GIN
+    indexed), ranked with ``SearchRank`` and paged by keyset.
+    """
+
+    def filter_queryset(self, queryset, params):
+        if params.get("location"):
+            queryset = queryset.filter(location=params["location"])
+        if params.get("salary_min") is not None:
+            queryset = queryset.filter(salary__gte=params["salary_min"])
+        if params.get("salary_max") is not None:
+            queryset = queryset.filter(salary__lte=params["salary_max"])
+        if params.get("posted_after"):
+            queryset = queryset.filter(created_at__gte=params["posted_after"])
+        if params.get("posted_before"):
+            queryset = queryset.filter(created_at__lte=params["posted_before"])
+        if params.get("q"):
+            queryset = queryset.filter(search_vector=self.get_query(params))
+        return queryset
+
+    def get_query(self, params):
+        return SearchQuery(params["q"], search_type="websearch", config=SEARCH_CONFIG)
+
+    def search(self, params, with_facets=False):
+        page_size = params["page_size"]
+        queryset = self.filter_queryset(Job.objects.only(*LIST_SOURCE_FIELDS), params)
+
+        if params.get("q"):
+            query = self.get_query(params)
+            # Cast to double so cursor values survive the JSON round-trip
+            # and compare exactly against the recomputed rank.
+            queryset = queryset.annotate(
+                rank=Cast(SearchRank(F("search_vector"), query), FloatField()),
+                snippet=SearchHeadline(
+                    "description",
+                    query,
+                    config=SEARCH_CONFIG,
+                    start_sel=HEADLINE_START_SEL,
+                    stop_sel=HEADLINE_STOP_SEL,
+                    max_fragments=1,
+                ),
+            )
+            ordering = ("-rank", "-created_at", "-id")
+        else:
+            ordering = ("-created_at", "-id")
+
+        if params.get("cursor"):
+            cursor = self.cursor_values(params["cursor"])
+            position = self.decode_position(ordering, cursor)
+            queryset = queryset.filter(keyset_filter(ordering, position))
+        jobs = list(queryset.order_by(*ordering)[: page_size + 1])
+
+        next_cursor = None
+        if len(jobs) > page_size:
+            jobs = jobs[:page_size]
+            next_cursor = self.make_cursor(
+                [
+                    self.encode_value(getattr(jobs[-1], field.lstrip("-")))
+                    for field in ordering
+                ]
+            )
+        page = {"results": [self.serialize(job) for job in jobs], "next": next_cursor}
+        if with_facets:
+            page["facets"] = self.facets(params)
+        return page
+
+    def facet_queryset(self, params, facet):
+        """Jobs matching ``params`` with every filter but ``facet``'s own."""
+        return self.filter_queryset(
+            Job.objects.all(), without_facet_filter(params, facet)
+        )
+
+    def facets(self, params):
+        locations = (
+            self.facet_queryset(params, "locations")
+            .values("location")
+            .annotate(count=Count("id"))
+            .order_by("-count", "location")[:LOCATION_FACET_SIZE]
+        )
+        salaries = (
+            self.facet_queryset(params, "salary")
+            .exclude(salary=None)
+            .annotate(
+                bucket=Floor(F("salary") / SALARY_FACET_INTERVAL)
+                * SALARY_FACET_INTERVAL
+            )
+            .values("bucket")
+            .annotate(count=Count("id"))
+            .order_by("bucket")
+        )
+        now = timezone.now()
+        posted = self.facet_queryset(params, "posted").aggregate(
+            **{
+                key: Count("id", filter=ModelQ(created_at__gte=now - delta))
+                for key, delta in POSTED_FACET_DELTAS.items()
+            }
+        )
+        return {
+            "locations": [
+                {"value": row["location"], "count": row["count"]} for row in locations
+            ],
+            "salary": [
+                {
+                    "from": float(row["bucket"]),
+                    "to": float(row["bucket"]) + SALARY_FACET_INTERVAL,
+                    "count": row["count"],
+                }
+                for row in salaries
+            ],
+            "posted": [
+                {"key": key, "count": posted[key]} for key in POSTED_FACET_DELTAS
+            ],
+        }
+
+    def suggest(self, params):
+        def prefixed(field):
+            return list(
+                Job.objects.filter(**{f"{field}__istartswith": params["q"]})
+                .order_by(field)
+                .values_list(field, flat=True)
+                .distinct()[: params["size"]]
+            )
+
+        return {"titles": prefixed("title"), "locations": prefixed("location")}
+
+    def encode_value(self, value):
+        if isinstance(value, datetime.datetime):
+            return value.isoformat()
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        return value
+
+    def decode_position(self, ordering, cursor):
+        """Reject positions of the wrong shape, e.g. from a tampered cursor."""
+        invalid = serializers.ValidationError({"cursor": "Invalid cursor."})
+        if len(cursor) != len(ordering):
+            raise invalid
+        *rank, created_at, pk = cursor
+        try:
+            created_at = parse_datetime(created_at)
+            pk = uuid.UUID(str(pk))
+        except (TypeError, ValueError):
+            raise invalid
+        if created_at is None or not all(
+            isinstance(value, (int, float)) for value in rank
+        ):
+            raise invalid
+        return [*rank, created_at, pk]
+
+    def serialize(self, job):
+        return {
+            "id": str(job.id),
+            "title": job.title,
+            "location": job.location,
+            "salary": float(job.salary) if job.salary is not None else None,
+            "created_at": job.created_at.isoformat(),
+            "snippet": headline_html(getattr(job, "snippet", None)),
+        }
+
+
+JOB_SEARCH_BACKENDS = {
+    JobElasticsearchBackend.name: JobElasticsearchBackend,
+    JobPostgresBackend.name: JobPostgresBackend,
+}
@@ -1,12 +1,65 @@
+from decimal import Decimal
+from django.db import models
 from rest_framework import serializers
-from .models import Job
+from applications.models import STATUS_CHOICES
+from .fragments import get_fragments
+from .models import APPLICATION_COUNTER_FIELDS, Job
+from .search import decode_search_after
+
+
+class JobListSerializer(serializers.ListSerializer):
+    """Builds the list from cached job fragments with one cache round-trip."""
+
+    def to_representation(self, data):
+        jobs = data.all() if isinstance(data, models.manager.BaseManager) else data
+        return get_fragments(
+            list(jobs), self.child.serialize, self.child.requested_fields
+        )
+
+
+class JobStatsListSerializer(JobListSerializer):
+    """Cached job fragments plus the application counts, which are not cached."""
+
+    def to_representation(self, data):
+        jobs = data.all() if isinstance(data, models.manager.BaseManager) else data
+        jobs = list(jobs)
+        fragments = super().to_representation(jobs)
+        return [
+            {**fragment, **self.child.get_stats(job)}
+            for fragment, job in zip(fragments, jobs)
+        ]
 
 
 class JobSerializer(serializers.ModelSerializer):
+    """
+    Pass ``fields`` to render only those fields (a sparse fieldset, see
+    ``parse_job_fields``); by default every field is rendered.
+    """
+
+    # Fragments fetched in advance by a parent list serializer, by job pk.
+    preloaded = None
+
     class Meta:
         model = Job
-        fields = "__all__"
-        read_only_fields = ["id", "posted_by", "created_at"]
+        exclude = ["search_vector", *APPLICATION_COUNTER_FIELDS]
+        read_only_fields = ["id", "posted_by", "created_at", "updated_at"]
+        list_serializer_class = JobListSerializer
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requested_fields = fields
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    def to_representation(self, instance):
+        if self.preloaded and instance.pk in self.preloaded:
+            return self.preloaded[instance.pk]
+        return get_fragments([instance], self.serialize, self.requested_fields)[0]
+
+    def serialize(self, instance):
+        """The uncached representation."""
+        return super().to_representation(instance)
 
     def validate_salary(self, value):
         if value is not None and value < 0:
@@ -17,3 +70,99 @@ class JobSerializer(serializers.ModelSerializer):
         if not value or len(value) < 3:
             raise serializers.ValidationError("Title must have at least 3 characters.")
         return value
+
+
+class JobWithStatsSerializer(JobSerializer):
+    """
+    A job with its application counts, read from the counter columns kept
+    by ``applications.counters``. The counts are not part of the cached
+    fragment, since they change without the job changing.
+    """
+
+    class Meta(JobSerializer.Meta):
+        list_serializer_class = JobStatsListSerializer
+
+    def to_representation(self, instance):
+        return {**super().to_representation(instance), **self.get_stats(instance)}
+
+    def get_stats(self, job):
+        return {
+            "applications_count": job.applications_count,
+            "applications_by_status": {
+                status: getattr(job, f"{status}_count") for status, _ in STATUS_CHOICES
+            },
+        }
+
+
+# Always loaded: the pk, the keyset ordering and the fragment cache version.
+ALWAYS_LOADED_FIELDS = {"id", "created_at", "updated_at"}
+
+
+def parse_job_fields(value, param="fields"):
+    """
+    Field names from a comma-separated ``?fields=`` value, or ``None`` for
+    all fields. Unknown names are a validation error on ``param``.
+    """
+    if not value:
+        return None
+    names = [name for name in dict.fromkeys(value.replace(" ", "").split(",")) if name]
+    unknown = set(names) - set(JobSerializer().fields)
+    if unknown:
+        raise serializers.ValidationError(
+            {param: f"Unknown fields: {', '.join(sorted(unknown))}."}
+        )
+    return names
+
+
+def job_deferred_fields(fields):
+    """
+    Model fields a queryset can ``defer()`` when rendering only ``fields``,
+    so large columns such as ``description`` are not read at all.
+    """
+    serializer_fields = JobSerializer().fields
+    skipped = set(serializer_fields) - set(fields or serializer_fields)
+    deferred = {serializer_fields[name].source for name in skipped}
+    return sorted((deferred - ALWAYS_LOADED_FIELDS) | {"search_vector"})
+
+
+class JobSearchParamsSerializer(serializers.Serializer):
+    """Validates and normalizes the query string of ``JobSearchView``."""
+
+    q = serializers.CharField(required=False, allow_blank=True, default="")
+    location = serializers.CharField(required=False)
+    salary_min = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=Decimal(0), required=False
+    )
+    salary_max = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=Decimal(0), required=False
+    )
+    posted_after = serializers.DateTimeField(required=False)
+    posted_before = serializers.DateTimeField(required=False)
+    page_size = serializers.IntegerField(
+        min_value=1, max_value=50, required=False, default=10
+    )
+    cursor = serializers.CharField(required=False)
+    facets = serializers.BooleanField(required=False, default=False)
+
+    def validate_cursor(self, value):
+        try:
+            return decode_search_after(value)
+        except ValueError:
+            raise serializers.ValidationError("Invalid cursor.")
+
+    def validate(self, attrs):
+        salary_min = attrs.get("salary_min")
+        salary_max = attrs.get("salary_max")
+        if salary_min is not None and salary_max is not None:
+            if salary_min > salary_max:
+                raise serializers.ValidationError(
+                    {"salary_max": "Must be greater than or equal to salary_min."}
+                )
+        return attrs
+
+
+class JobSuggestParamsSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=100)
+    size = serializers.IntegerField(
+        min_value=1, max_value=10, required=False, default=5
+    )
@@ -0,0 +1,38 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from search.cache import bump_generation
+from .models import Job
+from .search import JOB_INDEX, JOB_SEARCH_VECTOR
+
+SEARCH_VECTOR_SOURCES = {"title", "location", "description"}
+
+
+@receiver([post_save, post_delete], sender=Job)
+def invalidate_job_search_cache(sender, **kwargs):
+    transaction.on_commit(lambda: bump_generation(JOB_INDEX))
+
+
+@receiver(post_init, sender=Job)
+def remember_search_text(sender, instance, **kwargs):
+    # The indexed text as loaded, so saves that leave it alone skip the
+    # extra UPDATE. Read from __dict__ so deferred fields are not fetched.
+    instance._saved_search_text = search_text(instance)
+
+
+@receiver(post_save, sender=Job)
+def update_job_search_vector(sender, instance, created, **kwargs):
+    text = search_text(instance)
+    if created or text != instance._saved_search_text:
+        update_search_vectors(Job.objects.filter(pk=instance.pk))
+    instance._saved_search_text = text
+
+
+def search_text(job):
+    return {name: job.__dict__.get(name) for name in SEARCH_VECTOR_SOURCES}
+
+
+def update_search_vectors(queryset):
+    """Recompute the stored search vector, e.g. after ``bulk_create``."""
+    queryset.update(search_vector=JOB_SEARCH_VECTOR)
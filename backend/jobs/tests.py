@@ -1,9 +1,21 @@
+import json
+from io import StringIO
+
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.core.cache import cache
 from django.urls import reverse
+from jobseeker.idempotency import IN_PROGRESS, IdempotentPostMixin
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from applications.models import Application
 from .models import Job
+from .search import encode_search_after
+from .serializers import JobSerializer
 from unittest.mock import MagicMock
 
 # Using pytest.mark.django_db allows tests to access the database.
@@ -94,7 +106,69 @@ class TestJobListCreateView:
         url = reverse("job-list-create")
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) > 0
+        assert len(response.data["results"]) > 0
+
+    def test_list_jobs_paginates_with_cursor(self, api_client, recruiter_user):
+        """The list is paged newest-first with opaque cursors and no overlap."""
+        for i in range(5):
+            Job.objects.create(
+                title=f"Job {i}",
+                description="d",
+                location="l",
+                posted_by=recruiter_user,
+            )
+        url = reverse("job-list-create")
+
+        first = api_client.get(url, {"page_size": 3})
+        assert first.status_code == status.HTTP_200_OK
+        assert [job["title"] for job in first.data["results"]] == [
+            "Job 4",
+            "Job 3",
+            "Job 2",
+        ]
+        assert first.data["previous"] is None
+        assert first.data["next"] is not None
+
+        second = api_client.get(first.data["next"])
+        assert [job["title"] for job in second.data["results"]] == ["Job 1", "Job 0"]
+        assert second.data["next"] is None
+
+        back = api_client.get(second.data["previous"])
+        assert [job["title"] for job in back.data["results"]] == [
+            "Job 4",
+            "Job 3",
+            "Job 2",
+        ]
+
+    def test_cursor_seeks_the_index(self, test_job):
+        """The page filter is an index condition, not a filter over skipped rows."""
+        from jobseeker.pagination import keyset_filter
+
+        ordering = ("-created_at", "-id")
+        queryset = Job.objects.filter(
+            keyset_filter(ordering, [test_job.created_at, test_job.id])
+        ).order_by(*ordering)
+        with connection.cursor() as cursor:
+            # The test table is tiny; make the planner show the indexed plan.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain()
+        assert "job_created_id_idx" in plan
+        assert "Index Cond: (created_at <=" in plan
+
+    def test_list_jobs_caps_page_size(self, api_client, test_job):
+        """Clients cannot request more than the paginator's max page size."""
+        from .pagination import JobCursorPagination
+
+        url = reverse("job-list-create")
+        response = api_client.get(url, {"page_size": 10_000})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) <= JobCursorPagination.max_page_size
+
+    def test_list_jobs_invalid_cursor(self, api_client, test_job):
+        """A tampered cursor is rejected instead of raising a server error."""
+        url = reverse("job-list-create")
+        response = api_client.get(url, {"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_create_job_as_recruiter_success(self, api_client, recruiter_user):
         """A logged-in recruiter should be able to create a job."""
@@ -110,6 +184,20 @@ class TestJobListCreateView:
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["posted_by"] == recruiter_user.id
 
+    def test_create_job_in_progress_key_conflicts(self, api_client, recruiter_user):
+        """A retry racing the original request is told to wait, not run twice."""
+        api_client.force_authenticate(user=recruiter_user)
+        url = reverse("job-list-create")
+        request = MagicMock(path=url, user=recruiter_user)
+        key = IdempotentPostMixin().get_idempotency_cache_key(request, "abc")
+        cache.set(key, IN_PROGRESS)
+
+        data = {"title": "Platform Engineer", "description": "d", "location": "l"}
+        response = api_client.post(url, data, HTTP_IDEMPOTENCY_KEY="abc")
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert not Job.objects.filter(title="Platform Engineer").exists()
+
     def test_create_job_as_seeker_fail(self, api_client, seeker_user):
         """A job seeker should NOT be able to create a job."""
         api_client.force_authenticate(user=seeker_user)
@@ -119,6 +207,56 @@ class TestJobListCreateView:
         # This will be Forbidden because of IsAdminUser permission
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    def test_list_reuses_cached_job_fragments(
+        self, api_client, recruiter_user, test_job, mocker
+    ):
+        """Repeated lists only re-serialize jobs whose version changed."""
+        other = Job.objects.create(
+            title="Data Analyst",
+            description="d",
+            location="l",
+            posted_by=recruiter_user,
+        )
+        url = reverse("job-list-create")
+        serialize = mocker.spy(JobSerializer, "serialize")
+        first = api_client.get(url)
+        assert serialize.call_count == 2
+
+        api_client.get(url)
+        assert serialize.call_count == 2
+
+        other.title = "Senior Data Analyst"
+        other.save()
+        response = api_client.get(url)
+        assert serialize.call_count == 3
+        assert response.data["results"][0]["title"] == "Senior Data Analyst"
+        assert response.data["results"][1] == first.data["results"][1]
+
+    def test_list_sparse_fieldset(self, api_client, test_job):
+        """?fields= trims the payload and keeps description out of the query."""
+        url = reverse("job-list-create")
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {"fields": "id,title,location,salary"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == [
+            {
+                "id": str(test_job.id),
+                "title": "Backend Developer",
+                "location": "Lisbon",
+                "salary": "60000.00",
+            }
+        ]
+        assert not any('"description"' in query["sql"] for query in queries)
+        # The full representation is cached separately.
+        full = api_client.get(url).data["results"][0]
+        assert full["description"] == "Develop awesome APIs."
+
+    def test_list_rejects_unknown_fields(self, api_client, test_job):
+        response = api_client.get(reverse("job-list-create"), {"fields": "title,nope"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "nope" in str(response.data["fields"])
+
 
 # --- View Tests: Detail, Update, Delete ---
 
@@ -163,44 +301,739 @@ class TestJobDetailView:
         response = api_client.delete(url)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    def test_retrieve_sends_validators_and_honours_if_none_match(
+        self, api_client, test_job, mocker
+    ):
+        """A matching ETag gets a 304 without serializing the job."""
+        url = reverse("job-detail", kwargs={"pk": test_job.pk})
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response["ETag"]
+        assert response["Last-Modified"]
+
+        to_representation = mocker.spy(JobSerializer, "to_representation")
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        to_representation.assert_not_called()
+
+    def test_update_changes_etag(self, api_client, recruiter_user, test_job):
+        url = reverse("job-detail", kwargs={"pk": test_job.pk})
+        etag = api_client.get(url)["ETag"]
+
+        api_client.force_authenticate(user=recruiter_user)
+        api_client.patch(url, {"title": "Staff Backend Developer"})
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert response.data["title"] == "Staff Backend Developer"
+
+
+# --- Recruiter's own postings ---
+
+
+class TestMyJobListView:
+    def test_lists_own_jobs_with_application_counts(
+        self,
+        api_client,
+        recruiter_user,
+        seeker_user,
+        admin_user,
+        test_job,
+        django_assert_num_queries,
+    ):
+        quiet_job = Job.objects.create(
+            title="Data Engineer",
+            description="d",
+            location="l",
+            posted_by=recruiter_user,
+        )
+        Job.objects.create(
+            title="Not Mine", description="d", location="l", posted_by=admin_user
+        )
+        for user, app_status in [
+            (seeker_user, "applied"),
+            (admin_user, "viewed"),
+            (recruiter_user, "viewed"),
+        ]:
+            Application.objects.create(job=test_job, applicant=user, status=app_status)
+        api_client.force_authenticate(user=recruiter_user)
+
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse("my-jobs"))
+
+        assert response.status_code == status.HTTP_200_OK
+        quiet, busy = response.data["results"]
+        assert quiet["id"] == str(quiet_job.id)
+        assert quiet["applications_count"] == 0
+        assert busy["title"] == test_job.title
+        assert busy["applications_count"] == 3
+        assert busy["applications_by_status"] == {
+            "applied": 1,
+            "viewed": 2,
+            "rejected": 0,
+            "accepted": 0,
+        }
+
+    def test_seeker_cannot_list_postings(self, api_client, seeker_user):
+        api_client.force_authenticate(user=seeker_user)
+        response = api_client.get(reverse("my-jobs"))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
 
 # --- Search View Test with Mocking ---
 
 
-def test_job_search_view(api_client, mocker):
+@pytest.fixture
+def mock_job_search(mocker):
+    """
+    Mock the Elasticsearch Search object used by the job search.
+    Every chained builder call returns the same mock, so tests can configure
+    `execute()` once and inspect the calls made while building the query.
+    """
+    mock_search_class = mocker.patch("jobs.search.Search")
+    search = mock_search_class.return_value
+    for method in (
+        "query",
+        "filter",
+        "post_filter",
+        "sort",
+        "source",
+        "highlight",
+        "highlight_options",
+        "extra",
+    ):
+        getattr(search, method).return_value = search
+    search.execute.return_value = []
+    return search
+
+
+def make_job_hit(**overrides):
+    """A MagicMock that mimics an Elasticsearch hit with list fields only."""
+    hit = MagicMock()
+    hit.id = "some-uuid-string"
+    hit.title = "Mocked Job Title"
+    hit.location = "Mockville"
+    hit.salary = 99000
+    hit.created_at = "2025-01-01T00:00:00+00:00"
+    hit.meta.highlight.description = ["A <em>test</em> description."]
+    hit.meta.sort = [1.0, 1735689600000, "some-uuid-string"]
+    for name, value in overrides.items():
+        setattr(hit, name, value)
+    return hit
+
+
+def test_job_search_view(api_client, mock_job_search):
     """
     Test the search view by mocking the Elasticsearch Search object.
     This avoids needing a live Elasticsearch instance for the test.
     """
     url = reverse("job-search")
+    mock_job_search.execute.return_value = [make_job_hit()]
 
-    # 1. Create a mock search result object that mimics an Elasticsearch hit.
-    # We use MagicMock which can simulate any attribute or method call.
-    mock_hit = MagicMock()
-    mock_hit.id = "some-uuid-string"
-    mock_hit.title = "Mocked Job Title"
-    mock_hit.description = "A description from the mock."
-    mock_hit.location = "Mockville"
-    mock_hit.salary = 99000
+    response = api_client.get(url, {"q": "test"})
 
-    # 2. Mock the Search class from django_elasticsearch_dsl.
-    # `mocker` is a fixture from the pytest-mock library.
-    mock_search = mocker.patch("jobs.views.Search")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["results"]) == 1
+    result = response.data["results"][0]
+    assert result["title"] == "Mocked Job Title"
+    assert result["id"] == "some-uuid-string"
+    assert result["snippet"] == "A <em>test</em> description."
+    # List results do not ship the full description.
+    assert "description" not in result
+    assert response.data["next"] is None
 
-    # 3. Configure the mock's return value.
-    # We want `Search(...).query(...).execute()` to return our list of mock hits.
-    mock_search.return_value.query.return_value.execute.return_value = [mock_hit]
+    mock_job_search.query.assert_called_with(
+        "multi_match", query="test", fields=["title", "description", "location"]
+    )
+    mock_job_search.source.assert_called_with(
+        includes=["id", "title", "location", "salary", "created_at"]
+    )
+    # Description text is escaped, only the highlight tags are markup.
+    mock_job_search.highlight_options.assert_called_with(encoder="html")
 
-    # 4. Make the request to the view.
-    response = api_client.get(url, {"q": "test"})
 
-    # 5. Assert the results.
+def test_job_search_empty_query_browses(api_client, mock_job_search):
+    """An empty query becomes a sorted match_all browse."""
+    url = reverse("job-search")
+
+    response = api_client.get(url, {"q": ""})
+
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1
-    assert response.data[0]["title"] == "Mocked Job Title"
-    assert response.data[0]["id"] == "some-uuid-string"
+    mock_job_search.query.assert_called_with("match_all")
+    mock_job_search.sort.assert_called_with(
+        {"created_at": {"order": "desc"}}, {"id": {"order": "desc"}}
+    )
+    mock_job_search.highlight.assert_not_called()
 
-    # Optional: Assert that the Search object was called as expected.
-    mock_search.return_value.query.assert_called_with(
-        "multi_match", query="test", fields=["title", "description", "location"]
+
+def test_job_search_filters_use_filter_context(api_client, mock_job_search):
+    """Location and salary filters are sent as non-scoring filter clauses."""
+    from elasticsearch_dsl import Q
+
+    url = reverse("job-search")
+    api_client.get(
+        url,
+        {"q": "python", "location": "Lisbon", "salary_min": 1000, "salary_max": 5000},
+    )
+
+    mock_job_search.filter.assert_any_call(Q("term", **{"location.raw": "Lisbon"}))
+    mock_job_search.filter.assert_any_call(
+        Q("range", salary={"gte": 1000.0, "lte": 5000.0})
+    )
+
+
+def test_job_search_invalid_salary_range(api_client, mock_job_search):
+    """salary_min greater than salary_max is rejected before querying ES."""
+    url = reverse("job-search")
+    response = api_client.get(url, {"salary_min": 5000, "salary_max": 1000})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    mock_job_search.execute.assert_not_called()
+
+
+def test_job_search_paginates_with_search_after(api_client, mock_job_search):
+    """A full page yields a next link whose cursor feeds search_after."""
+    from .search import decode_search_after
+    from urllib.parse import parse_qs, urlparse
+
+    url = reverse("job-search")
+    mock_job_search.execute.return_value = [
+        make_job_hit(id="first"),
+        make_job_hit(id="second"),
+    ]
+
+    response = api_client.get(url, {"q": "dev", "page_size": 1})
+
+    assert len(response.data["results"]) == 1
+    cursor = parse_qs(urlparse(response.data["next"]).query)["cursor"][0]
+    assert decode_search_after(cursor) == {
+        "backend": "elasticsearch",
+        "values": [1.0, 1735689600000, "some-uuid-string"],
+    }
+
+    api_client.get(url, {"q": "dev", "page_size": 1, "cursor": cursor})
+    mock_job_search.extra.assert_called_with(
+        size=2,
+        track_total_hits=False,
+        search_after=[1.0, 1735689600000, "some-uuid-string"],
+    )
+
+
+def test_job_search_is_cached_until_jobs_change(
+    api_client, mock_job_search, recruiter_user, django_capture_on_commit_callbacks
+):
+    """Identical searches hit ES once until a Job save bumps the generation."""
+    url = reverse("job-search")
+    mock_job_search.execute.return_value = [make_job_hit()]
+
+    first = api_client.get(url, {"q": "python remote"})
+    second = api_client.get(url, {"q": "Python  Remote"})
+    assert first.data == second.data
+    assert mock_job_search.execute.call_count == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Job.objects.create(
+            title="Python Remote",
+            description="d",
+            location="Remote",
+            posted_by=recruiter_user,
+        )
+    api_client.get(url, {"q": "python remote"})
+    assert mock_job_search.execute.call_count == 2
+
+
+def make_facet_aggregations():
+    """Mimic ``response.aggregations`` for the facet aggregations."""
+    aggregations = MagicMock()
+    aggregations.locations.locations.buckets = [
+        MagicMock(key="Lisbon", doc_count=3)
+    ]
+    aggregations.salary.salary.buckets = [MagicMock(key=40000.0, doc_count=2)]
+    aggregations.posted.posted.buckets = [MagicMock(key="past_week", doc_count=1)]
+    return aggregations
+
+
+def test_job_search_returns_facets_in_one_request(api_client, mock_job_search):
+    """Facets ride on the hits request and are cached separately."""
+    url = reverse("job-search")
+    response_mock = MagicMock()
+    response_mock.__iter__.return_value = iter([make_job_hit()])
+    response_mock.aggregations = make_facet_aggregations()
+    mock_job_search.execute.return_value = response_mock
+
+    response = api_client.get(
+        url, {"q": "python", "location": "Lisbon", "facets": "true"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["results"]) == 1
+    assert response.data["facets"] == {
+        "locations": [{"value": "Lisbon", "count": 3}],
+        "salary": [{"from": 40000.0, "to": 50000.0, "count": 2}],
+        "posted": [{"key": "past_week", "count": 1}],
+    }
+    assert mock_job_search.execute.call_count == 1
+    assert mock_job_search.aggs.bucket.call_count == 3
+    # The filters narrow the hits only, not what the facets count.
+    mock_job_search.post_filter.assert_called_once()
+    mock_job_search.filter.assert_not_called()
+
+    # Without facets the response keeps its usual shape.
+    response = api_client.get(url, {"q": "python"})
+    assert "facets" not in response.data
+
+
+def test_job_search_reuses_cached_facets_for_next_page(api_client, mock_job_search):
+    """Paging through results does not recompute the facets."""
+    url = reverse("job-search")
+    response_mock = MagicMock()
+    response_mock.__iter__.return_value = iter([make_job_hit()])
+    response_mock.aggregations = make_facet_aggregations()
+    mock_job_search.execute.return_value = response_mock
+    api_client.get(url, {"q": "python", "facets": "true"})
+
+    mock_job_search.execute.return_value = []
+    mock_job_search.aggs.bucket.reset_mock()
+    cursor = encode_search_after(
+        {"backend": "elasticsearch", "values": [1.0, 1735689600000, "some-uuid-string"]}
+    )
+    response = api_client.get(url, {"q": "python", "facets": "true", "cursor": cursor})
+
+    assert response.data["facets"]["locations"] == [{"value": "Lisbon", "count": 3}]
+    mock_job_search.aggs.bucket.assert_not_called()
+
+
+# --- Postgres search backend ---
+
+
+class TestJobPostgresBackend:
+    @pytest.fixture
+    def jobs(self, recruiter_user):
+        return [
+            Job.objects.create(
+                title="Python Developer",
+                description="Build Django services.",
+                location="Lisbon",
+                salary=50000,
+                posted_by=recruiter_user,
+            ),
+            Job.objects.create(
+                title="Frontend Engineer",
+                description="React work with some Python tooling.",
+                location="Porto",
+                salary=40000,
+                posted_by=recruiter_user,
+            ),
+            Job.objects.create(
+                title="Accountant",
+                description="Numbers.",
+                location="Lisbon",
+                salary=30000,
+                posted_by=recruiter_user,
+            ),
+        ]
+
+    def search(self, **params):
+        from .search import JobPostgresBackend
+        from .serializers import JobSearchParamsSerializer
+
+        serializer = JobSearchParamsSerializer(data=params)
+        serializer.is_valid(raise_exception=True)
+        return JobPostgresBackend().search(serializer.validated_data)
+
+    def test_search_vector_is_maintained_on_save(self, jobs):
+        job = Job.objects.get(pk=jobs[0].pk)
+        assert job.search_vector is not None
+
+    def test_search_vector_is_only_recomputed_when_text_changes(
+        self, jobs, django_assert_num_queries
+    ):
+        job = Job.objects.get(pk=jobs[0].pk)
+        job.salary = 55000
+        with django_assert_num_queries(1):
+            job.save()
+
+        job.title = "Rust Developer"
+        with django_assert_num_queries(2):
+            job.save()
+        assert [result["title"] for result in self.search(q="rust")["results"]] == [
+            "Rust Developer"
+        ]
+
+    def test_ranks_title_matches_first(self, jobs):
+        page = self.search(q="python")
+        assert [job["title"] for job in page["results"]] == [
+            "Python Developer",
+            "Frontend Engineer",
+        ]
+        assert "<em>" in page["results"][1]["snippet"]
+
+    def test_snippet_escapes_description_html(self, recruiter_user):
+        Job.objects.create(
+            title="Go Developer",
+            description="Go <img src=x onerror=alert(1)> <script>alert(2)</script>",
+            location="Remote",
+            posted_by=recruiter_user,
+        )
+
+        snippet = self.search(q="go")["results"][0]["snippet"]
+
+        assert "<script>" not in snippet
+        assert "<img" not in snippet
+        assert "&lt;img src=x onerror=alert" in snippet
+        assert "<em>Go</em>" in snippet
+
+    def test_applies_filters(self, jobs):
+        page = self.search(location="Lisbon", salary_min=40000)
+        assert [job["title"] for job in page["results"]] == ["Python Developer"]
+
+    def test_browse_pages_with_cursor(self, jobs):
+        first = self.search(page_size=2)
+        assert [job["title"] for job in first["results"]] == [
+            "Accountant",
+            "Frontend Engineer",
+        ]
+        second = self.search(
+            page_size=2, cursor=encode_search_after(first["next"])
+        )
+        assert [job["title"] for job in second["results"]] == ["Python Developer"]
+        assert second["next"] is None
+
+    def test_facets(self, jobs):
+        from .search import JobPostgresBackend
+
+        facets = JobPostgresBackend().facets({"q": "python"})
+        assert facets["locations"] == [
+            {"value": "Lisbon", "count": 1},
+            {"value": "Porto", "count": 1},
+        ]
+        assert facets["salary"] == [
+            {"from": 40000.0, "to": 50000.0, "count": 1},
+            {"from": 50000.0, "to": 60000.0, "count": 1},
+        ]
+        assert {"key": "past_day", "count": 2} in facets["posted"]
+
+    def test_facets_ignore_their_own_filter(self, jobs):
+        from .search import JobPostgresBackend
+
+        # Porto is still offered although the hits are narrowed to Lisbon.
+        facets = JobPostgresBackend().facets({"q": "python", "location": "Lisbon"})
+        assert facets["locations"] == [
+            {"value": "Lisbon", "count": 1},
+            {"value": "Porto", "count": 1},
+        ]
+        assert facets["salary"] == [{"from": 50000.0, "to": 60000.0, "count": 1}]
+
+        # The other filters still apply: Porto's job pays too little.
+        facets = JobPostgresBackend().facets(
+            {"q": "python", "location": "Lisbon", "salary_min": 45000}
+        )
+        assert facets["locations"] == [{"value": "Lisbon", "count": 1}]
+
+
+def test_job_search_falls_back_to_postgres(api_client, settings, mocker, test_job):
+    """When the Elasticsearch health check fails, Postgres answers."""
+    settings.SEARCH_FALLBACK_BACKEND = "postgres"
+    mocker.patch(
+        "search.backends.ElasticsearchBackend.is_available", return_value=False
+    )
+
+    response = api_client.get(reverse("job-search"), {"q": "backend"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [job["id"] for job in response.data["results"]] == [str(test_job.id)]
+
+
+@pytest.mark.parametrize("status_code, marked_down", [(503, True), (400, False)])
+def test_job_search_falls_back_on_elasticsearch_error(
+    api_client, settings, mocker, mock_job_search, test_job, status_code, marked_down
+):
+    """Errors from a cluster that passed the health check fall back too."""
+    from elasticsearch import ApiError
+    from search.backends import ELASTICSEARCH_HEALTH_KEY
+
+    settings.SEARCH_FALLBACK_BACKEND = "postgres"
+    cache.set(ELASTICSEARCH_HEALTH_KEY, True)
+    mock_job_search.execute.side_effect = ApiError(
+        "search_phase_execution_exception", meta=MagicMock(status=status_code), body={}
+    )
+
+    response = api_client.get(reverse("job-search"), {"q": "backend"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [job["id"] for job in response.data["results"]] == [str(test_job.id)]
+    # Only server-side errors route the following searches away.
+    assert cache.get(ELASTICSEARCH_HEALTH_KEY) is not marked_down
+
+
+def test_job_search_rejects_cursor_from_other_backend(api_client, mock_job_search):
+    """A fallback cursor replayed once Elasticsearch is back is a 400."""
+    cursor = encode_search_after(
+        {
+            "backend": "postgres",
+            "values": [
+                "2025-01-01T00:00:00+00:00",
+                "2b1e0c4e-0000-0000-0000-000000000000",
+            ],
+        }
+    )
+
+    response = api_client.get(reverse("job-search"), {"cursor": cursor})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "cursor" in response.data
+    mock_job_search.execute.assert_not_called()
+
+
+def test_job_search_is_rate_limited(
+    api_client, settings, mocker, mock_job_search, recruiter_user
+):
+    settings.THROTTLE_RATES = {"search": "60/min", "search:recruiter": "600/min"}
+    script = mocker.patch("jobseeker.throttling.token_bucket_script").return_value
+    script.return_value = [0, 1500]
+
+    response = api_client.get(reverse("job-search"), {"q": "python"})
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response["Retry-After"] == "2"
+    mock_job_search.execute.assert_not_called()
+    assert script.call_args.kwargs == {
+        "keys": ["throttle:search:ip:127.0.0.1"],
+        "args": [60, 1.0],
+    }
+
+    script.return_value = [1, 0]
+    api_client.force_authenticate(user=recruiter_user)
+    response = api_client.get(reverse("job-search"), {"q": "python"})
+    assert response.status_code == status.HTTP_200_OK
+    assert script.call_args.kwargs == {
+        "keys": [f"throttle:search:user:{recruiter_user.pk}"],
+        "args": [600, 10.0],
+    }
+
+
+def test_throttle_lets_requests_through_without_redis(
+    api_client, settings, mocker, mock_job_search
+):
+    from redis.exceptions import ConnectionError
+
+    settings.THROTTLE_RATES = {"search": "60/min"}
+    script = mocker.patch("jobseeker.throttling.token_bucket_script").return_value
+    script.side_effect = ConnectionError("down")
+
+    response = api_client.get(reverse("job-search"), {"q": "python"})
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+# --- Typeahead ---
+
+
+def test_job_suggest_view(api_client, mocker):
+    """Suggestions come from the completion subfields in one request."""
+    mock_search_class = mocker.patch("jobs.search.Search")
+    search = mock_search_class.return_value
+    for method in ("extra", "source", "suggest"):
+        getattr(search, method).return_value = search
+
+    def options(*texts):
+        suggestion = MagicMock()
+        suggestion.options = [MagicMock(text=text) for text in texts]
+        return [suggestion]
+
+    search.execute.return_value.suggest = {
+        "titles": options("Python Developer", "Python Engineer"),
+        "locations": options(),
+    }
+
+    response = api_client.get(reverse("job-suggest"), {"q": "pyt", "size": 2})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {
+        "titles": ["Python Developer", "Python Engineer"],
+        "locations": [],
+    }
+    search.suggest.assert_any_call(
+        "titles",
+        "pyt",
+        completion={"field": "title.suggest", "size": 2, "skip_duplicates": True},
     )
+    search.source.assert_called_with(False)
+
+
+def test_job_suggest_view_caches_and_caps_size(api_client, mocker):
+    """Sizes above the cap are rejected and repeated prefixes are cached."""
+    mock_search_class = mocker.patch("jobs.search.Search")
+    search = mock_search_class.return_value
+    for method in ("extra", "source", "suggest"):
+        getattr(search, method).return_value = search
+
+    assert (
+        api_client.get(reverse("job-suggest"), {"q": "py", "size": 500}).status_code
+        == status.HTTP_400_BAD_REQUEST
+    )
+
+    url = reverse("job-suggest")
+    search.execute.return_value.suggest = {
+        "titles": [MagicMock(options=[])],
+        "locations": [MagicMock(options=[])],
+    }
+    api_client.get(url, {"q": "py"})
+    api_client.get(url, {"q": "PY"})
+    assert search.execute.call_count == 1
+
+
+def test_job_suggest_postgres_backend(test_job):
+    from .search import JobPostgresBackend
+
+    suggestions = JobPostgresBackend().suggest({"q": "back", "size": 5})
+    assert suggestions == {"titles": ["Backend Developer"], "locations": []}
+
+
+# --- Bulk import ---
+
+
+class TestJobImport:
+    def test_json_import_reports_invalid_rows(
+        self, api_client, recruiter_user, mocker, django_capture_on_commit_callbacks
+    ):
+        enqueue_many = mocker.patch("jobs.importing.enqueue_many")
+        api_client.force_authenticate(user=recruiter_user)
+        rows = [
+            {"title": "Data Engineer", "description": "d", "location": "Lisbon"},
+            {"title": "QA", "description": "d", "location": "Porto"},
+            {"title": "SRE", "description": "d", "location": "Porto", "salary": -1},
+            {"title": "Designer", "description": "d", "location": "Braga"},
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(reverse("job-import"), rows, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["created"] == 2
+        assert [error["row"] for error in response.data["errors"]] == [2, 3]
+        assert "title" in response.data["errors"][0]["errors"]
+        assert "salary" in response.data["errors"][1]["errors"]
+        jobs = Job.objects.filter(posted_by=recruiter_user)
+        assert sorted(jobs.values_list("title", flat=True)) == [
+            "Data Engineer",
+            "Designer",
+        ]
+        assert all(job.search_vector is not None for job in jobs)
+        enqueue_many.assert_called_once()
+        assert set(enqueue_many.call_args.args[1]) == {job.pk for job in jobs}
+
+    def test_csv_import_in_batches(self, api_client, recruiter_user, settings, mocker):
+        mocker.patch("jobs.importing.enqueue_many")
+        settings.JOB_IMPORT_BATCH_SIZE = 2
+        api_client.force_authenticate(user=recruiter_user)
+        upload = SimpleUploadedFile(
+            "jobs.csv",
+            b"title,description,location,salary\n"
+            b"Backend Dev,d,Lisbon,50000\n"
+            b"Frontend Dev,d,Porto,\n"
+            b"Mobile Dev,d,Braga,45000\n",
+            content_type="text/csv",
+        )
+
+        response = api_client.post(
+            reverse("job-import"), {"file": upload}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data == {"created": 3, "errors": []}
+        assert Job.objects.get(title="Frontend Dev").salary is None
+
+    def test_csv_import_rejects_other_encodings(self, api_client, recruiter_user):
+        api_client.force_authenticate(user=recruiter_user)
+        upload = SimpleUploadedFile(
+            "jobs.csv",
+            "title,description,location\nCafé Manager,d,Évora\n".encode("latin-1"),
+            content_type="text/csv",
+        )
+
+        response = api_client.post(
+            reverse("job-import"), {"file": upload}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "file" in response.data
+        assert not Job.objects.exists()
+
+    def test_rejects_payload_without_valid_rows(self, api_client, recruiter_user):
+        api_client.force_authenticate(user=recruiter_user)
+        url = reverse("job-import")
+        response = api_client.post(url, {"title": "One"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response = api_client.post(url, [{"title": "x"}], format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["created"] == 0
+        assert not Job.objects.exists()
+
+    def test_seeker_cannot_import(self, api_client, seeker_user):
+        api_client.force_authenticate(user=seeker_user)
+        response = api_client.post(reverse("job-import"), [], format="json")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_import_jobs_command(self, recruiter_user, tmp_path, mocker):
+        mocker.patch("jobs.importing.enqueue_many")
+        path = tmp_path / "jobs.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {"title": "Support Lead", "description": "d", "location": "Remote"},
+                    {"title": "", "description": "d", "location": "Remote"},
+                ]
+            )
+        )
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command(
+            "import_jobs",
+            str(path),
+            posted_by=recruiter_user.username,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+        assert "Imported 1 jobs" in stdout.getvalue()
+        assert "Row 2" in stderr.getvalue()
+        assert Job.objects.filter(title="Support Lead").exists()
+
+
+# --- Export ---
+
+
+class TestJobExport:
+    def export(self, api_client, **params):
+        response = api_client.get(reverse("job-export"), params)
+        assert response.streaming
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_export(self, api_client, admin_user, test_job):
+        api_client.force_authenticate(user=admin_user)
+        lines = self.export(api_client).splitlines()
+        assert len(lines) == 1
+        row = json.loads(lines[0])
+        assert row["id"] == str(test_job.id)
+        assert row["posted_by_id"] == str(test_job.posted_by_id)
+        assert row["created_at"] == test_job.created_at.isoformat()
+
+    def test_csv_export(self, api_client, admin_user, test_job):
+        api_client.force_authenticate(user=admin_user)
+        lines = self.export(api_client, output="csv").splitlines()
+        assert lines[0] == (
+            "id,title,description,location,salary,posted_by_id,created_at"
+        )
+        assert lines[1].startswith(f"{test_job.id},Backend Developer,")
+
+    def test_unknown_output(self, api_client, admin_user):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(reverse("job-export"), {"output": "xml"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_recruiter_cannot_export(self, api_client, recruiter_user):
+        api_client.force_authenticate(user=recruiter_user)
+        response = api_client.get(reverse("job-export"))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
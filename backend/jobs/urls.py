@@ -1,8 +1,20 @@
 from django.urls import path
-from .views import JobListCreateView, JobDetailView, JobSearchView
+from .views import (
+    JobListCreateView,
+    JobDetailView,
+    JobExportView,
+    JobImportView,
+    JobSearchView,
+    JobSuggestView,
+    MyJobListView,
+)
 
 urlpatterns = [
     path("jobs/", JobListCreateView.as_view(), name="job-list-create"),
+    path("jobs/mine/", MyJobListView.as_view(), name="my-jobs"),
     path("jobs/<uuid:pk>/", JobDetailView.as_view(), name="job-detail"),
+    path("jobs/export/", JobExportView.as_view(), name="job-export"),
+    path("jobs/import/", JobImportView.as_view(), name="job-import"),
     path("jobs/search/", JobSearchView.as_view(), name="job-search"),
+    path("jobs/suggest/", JobSuggestView.as_view(), name="job-suggest"),
 ]
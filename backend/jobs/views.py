@@ -1,15 +1,60 @@
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, status
+from rest_framework.parsers import JSONParser, MultiPartParser
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django_elasticsearch_dsl.search import Search
+from rest_framework.utils.urls import replace_query_param
+from django.conf import settings
+from accounts.permissions import IsAdmin, IsRecruiter
+from jobseeker.conditional import ConditionalRetrieveMixin
+from jobseeker.export import StreamingExportView
+from jobseeker.idempotency import IdempotentPostMixin
+from search.backends import run_search, with_fallback
+from .importing import import_jobs, read_csv
 from .models import Job
-from .serializers import JobSerializer
+from .pagination import JobCursorPagination
+from .search import (
+    JOB_INDEX,
+    JOB_SEARCH_BACKENDS,
+    encode_search_after,
+    search_jobs_with_facets,
+)
+from .serializers import (
+    JobSearchParamsSerializer,
+    JobSerializer,
+    JobWithStatsSerializer,
+    JobSuggestParamsSerializer,
+    job_deferred_fields,
+    parse_job_fields,
+)
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 
 
-class JobListCreateView(generics.ListCreateAPIView):
+class SparseJobFieldsMixin:
+    """
+    ``?fields=title,location`` on GET renders only those job fields, and the
+    queryset defers the columns that are not needed.
+    """
+
+    def get_sparse_fields(self):
+        if self.request.method != "GET":
+            return None
+        return parse_job_fields(self.request.query_params.get("fields"))
+
+    def get_queryset(self):
+        deferred = job_deferred_fields(self.get_sparse_fields())
+        return super().get_queryset().defer(*deferred)
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.get_sparse_fields())
+        return super().get_serializer(*args, **kwargs)
+
+
+class JobListCreateView(
+    IdempotentPostMixin, SparseJobFieldsMixin, generics.ListCreateAPIView
+):
     queryset = Job.objects.all()
     serializer_class = JobSerializer
+    pagination_class = JobCursorPagination
 
     def get_permissions(self):
         if self.request.method == "POST":
@@ -22,7 +67,28 @@ class JobListCreateView(generics.ListCreateAPIView):
         serializer.save(posted_by=self.request.user)
 
 
-class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
+class MyJobListView(SparseJobFieldsMixin, generics.ListAPIView):
+    """
+    The requesting recruiter's postings, newest first, each with its total
+    and per-status application counts. The counts are columns kept up to
+    date by ``applications.counters``, so a page is one indexed query
+    however many applications there are.
+    """
+
+    queryset = Job.objects.all()
+    serializer_class = JobWithStatsSerializer
+    pagination_class = JobCursorPagination
+    permission_classes = [IsRecruiter | IsAdmin]
+
+    def get_queryset(self):
+        return super().get_queryset().filter(posted_by=self.request.user)
+
+
+class JobDetailView(
+    SparseJobFieldsMixin,
+    ConditionalRetrieveMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     queryset = Job.objects.all()
     serializer_class = JobSerializer
 
@@ -34,23 +100,111 @@ class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
         return [IsAuthenticatedOrReadOnly()]
 
 
+class JobImportView(APIView):
+    """
+    Create many jobs at once from a JSON array of job objects, or from a
+    CSV file uploaded as ``file`` with the job fields as header. Valid rows
+    are created; invalid ones are listed in ``errors`` by row number.
+    """
+
+    permission_classes = [IsRecruiter | IsAdmin]
+    parser_classes = [JSONParser, MultiPartParser]
+
+    def post(self, request):
+        if "file" in request.FILES:
+            try:
+                rows = read_csv(request.FILES["file"])
+            except UnicodeDecodeError:
+                return Response(
+                    {"file": ["The CSV file must be UTF-8 encoded."]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        elif isinstance(request.data, list):
+            rows = request.data
+        else:
+            return Response(
+                {"detail": "Send a JSON array of jobs or a CSV file as 'file'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not rows:
+            return Response(
+                {"detail": "No rows to import."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(rows) > settings.JOB_IMPORT_MAX_ROWS:
+            return Response(
+                {
+                    "detail": f"At most {settings.JOB_IMPORT_MAX_ROWS} rows "
+                    "per import."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        report = import_jobs(rows, posted_by=request.user)
+        if not report["created"]:
+            return Response(report, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_201_CREATED)
+
+
+class JobExportView(StreamingExportView):
+    permission_classes = [IsAdmin]
+    filename = "jobs"
+    fields = (
+        "id",
+        "title",
+        "description",
+        "location",
+        "salary",
+        "posted_by_id",
+        "created_at",
+    )
+
+    def get_queryset(self):
+        return Job.objects.all()
+
+
 class JobSearchView(APIView):
     permission_classes = [permissions.AllowAny]
+    throttle_scope = "search"
+
+    def get(self, request):
+        params = JobSearchParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        search_params = dict(params.validated_data)
+        if search_params.pop("facets"):
+            page = with_fallback(
+                JOB_SEARCH_BACKENDS,
+                lambda backend: search_jobs_with_facets(backend, search_params),
+            )
+        else:
+            page = run_search(JOB_INDEX, JOB_SEARCH_BACKENDS, search_params)
+        next_link = None
+        if page["next"]:
+            next_link = replace_query_param(
+                request.build_absolute_uri(),
+                "cursor",
+                encode_search_after(page["next"]),
+            )
+        data = {"next": next_link, "results": page["results"]}
+        if "facets" in page:
+            data["facets"] = page["facets"]
+        return Response(data)
+
+
+class JobSuggestView(APIView):
+    """Typeahead for the search box: job titles and locations by prefix."""
+
+    permission_classes = [permissions.AllowAny]
+    throttle_scope = "suggest"
 
     def get(self, request):
-        query = request.query_params.get("q", "")
-        s = Search(index="jobs").query(
-            "multi_match", query=query, fields=["title", "description", "location"]
+        params = JobSuggestParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        suggestions = run_search(
+            JOB_INDEX,
+            JOB_SEARCH_BACKENDS,
+            params.validated_data,
+            method="suggest",
+            prefix="suggest",
+            timeout=settings.SUGGEST_CACHE_TIMEOUT,
         )
-        response = s.execute()
-        results = [
-            {
-                "id": hit.id,
-                "title": hit.title,
-                "description": hit.description,
-                "location": hit.location,
-                "salary": hit.salary,
-            }
-            for hit in response
-        ]
-        return Response(results)
+        return Response(suggestions)
@@ -0,0 +1,38 @@
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+class ConditionalRetrieveMixin:
+    """
+    Conditional GET for ``RetrieveModelMixin`` views, driven by a row
+    version field. A request whose ``If-None-Match`` / ``If-Modified-Since``
+    matches gets a 304 before the serializer runs; other responses carry
+    ``ETag`` and ``Last-Modified`` so clients can revalidate next time.
+    """
+
+    version_field = "updated_at"
+
+    def get_validators(self, instance):
+        version = getattr(instance, self.version_field)
+        etag = quote_etag(f"{instance.pk}-{version.timestamp():.6f}")
+        return etag, int(version.timestamp())
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag, last_modified = self.get_validators(instance)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = Response(self.get_serializer(instance).data)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        # Per-user data: browsers may keep it but must revalidate each time.
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Authorization"])
+        return response
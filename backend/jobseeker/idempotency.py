@@ -0,0 +1,73 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+IN_PROGRESS = "in-progress"
+
+
+class IdempotentPostMixin:
+    """
+    Honour an ``Idempotency-Key`` header on POST. The first response for a
+    key is stored in the cache (Redis) and replayed for retries carrying
+    the same key and body, so a client can safely repeat a request whose
+    answer it never received. Reusing a key with a different body is a
+    422; a retry racing the original request gets a 409.
+    """
+
+    idempotency_header = "Idempotency-Key"
+
+    def post(self, request, *args, **kwargs):
+        idempotency_key = request.headers.get(self.idempotency_header)
+        if not idempotency_key:
+            return super().post(request, *args, **kwargs)
+        if len(idempotency_key) > 255:
+            return Response(
+                {"detail": f"{self.idempotency_header} is too long."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        key = self.get_idempotency_cache_key(request, idempotency_key)
+        fingerprint = hashlib.sha256(request.body).hexdigest()
+        # Claim the key atomically (SET NX) before doing any work.
+        if not cache.add(key, IN_PROGRESS, settings.IDEMPOTENCY_LOCK_TIMEOUT):
+            return self.replay(cache.get(key), fingerprint)
+
+        try:
+            response = super().post(request, *args, **kwargs)
+        except Exception:
+            cache.delete(key)
+            raise
+        if response.status_code >= 500:
+            # Let the client retry server errors for real.
+            cache.delete(key)
+            return response
+        stored = {
+            "fingerprint": fingerprint,
+            "status": response.status_code,
+            "data": response.data,
+        }
+        cache.set(key, stored, settings.IDEMPOTENCY_KEY_TIMEOUT)
+        return response
+
+    def get_idempotency_cache_key(self, request, idempotency_key):
+        owner = request.user.pk if request.user.is_authenticated else "anonymous"
+        digest = hashlib.sha256(idempotency_key.encode("utf-8")).hexdigest()
+        return f"idempotency:{request.path}:{owner}:{digest}"
+
+    def replay(self, stored, fingerprint):
+        if stored is None or stored == IN_PROGRESS:
+            return Response(
+                {"detail": "A request with this Idempotency-Key is in progress."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        if stored["fingerprint"] != fingerprint:
+            return Response(
+                {"detail": "This Idempotency-Key was used with a different body."},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        response = Response(stored["data"], status=stored["status"])
+        response["Idempotent-Replayed"] = "true"
+        return response
@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def get_redis_client():
+    """
+    Shared Redis client for raw data-structure commands (sets, counters,
+    scripts) that the Django cache API does not expose.
+    """
+    return redis.Redis.from_url(settings.REDIS_URL)
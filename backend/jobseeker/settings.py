@@ -31,6 +31,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third-party apps
     "rest_framework",
     "rest_framework_simplejwt",
@@ -41,6 +42,8 @@ INSTALLED_APPS = [
     "jobs",
     "profiles",
     "applications",
+    "search",
+    "notifications",
 ]
 
 
@@ -102,6 +105,22 @@ DATABASES = {
 }
 
 
+# Password hashing: the first hasher hashes new passwords, the others only
+# verify existing ones. PBKDF2 iterations default to Django's own.
+PASSWORD_HASH_ITERATIONS = int(os.getenv("PASSWORD_HASH_ITERATIONS", 870000))
+PASSWORD_HASHERS = list(
+    dict.fromkeys(
+        [
+            os.getenv("PASSWORD_HASHER", "accounts.hashers.PBKDF2PasswordHasher"),
+            "accounts.hashers.PBKDF2PasswordHasher",
+            "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+            "django.contrib.auth.hashers.Argon2PasswordHasher",
+            "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+            "django.contrib.auth.hashers.ScryptPasswordHasher",
+        ]
+    )
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -143,29 +162,125 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Redis used for raw data structures (queues, counters, scripts)
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/2")
+
+# Cache configuration
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_CACHE_URL", "redis://redis:6379/1"),
+        "KEY_PREFIX": "jobseeker",
+    }
+}
+
+# Seconds a search result page stays cached. Entries are also invalidated
+# as soon as the underlying index changes.
+SEARCH_CACHE_TIMEOUT = int(os.getenv("SEARCH_CACHE_TIMEOUT", 300))
+# Search facets change slowly, so they are not invalidated on every write
+# and simply expire.
+FACETS_CACHE_TIMEOUT = int(os.getenv("FACETS_CACHE_TIMEOUT", 120))
+# Serialized jobs, keyed by id and updated_at, so edits never serve stale data.
+JOB_FRAGMENT_CACHE_TIMEOUT = int(os.getenv("JOB_FRAGMENT_CACHE_TIMEOUT", 3600))
+# Typeahead suggestions repeat heavily and tolerate a little staleness.
+SUGGEST_CACHE_TIMEOUT = int(os.getenv("SUGGEST_CACHE_TIMEOUT", 60))
+# Pages of the user directory; new accounts show up once they expire.
+USER_DIRECTORY_CACHE_TIMEOUT = int(os.getenv("USER_DIRECTORY_CACHE_TIMEOUT", 30))
+
 # Celery configuration
 CELERY_BROKER_URL = "redis://redis:6379/0"
 CELERY_RESULT_BACKEND = "redis://redis:6379/0"
+CELERY_BEAT_SCHEDULE = {
+    # Retries and messages whose drain could not be scheduled at commit.
+    "drain-outbox": {
+        "task": "notifications.tasks.drain_outbox",
+        "schedule": float(os.getenv("OUTBOX_SWEEP_INTERVAL", 60)),
+    },
+    # One summary email per interval for users in digest mode.
+    "send-notification-digests": {
+        "task": "notifications.tasks.send_notification_digests",
+        "schedule": float(os.getenv("NOTIFICATION_DIGEST_INTERVAL", 3600)),
+    },
+}
+
+# Outbox: messages per locked batch, attempts before a message is marked
+# failed, and the retry backoff (seconds, doubled per attempt, capped).
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 100))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 8))
+OUTBOX_RETRY_DELAY = int(os.getenv("OUTBOX_RETRY_DELAY", 30))
+OUTBOX_MAX_RETRY_DELAY = int(os.getenv("OUTBOX_MAX_RETRY_DELAY", 3600))
 
 # Elasticsearch configuration
 ELASTICSEARCH_DSL = {
     "default": {"hosts": "http://elasticsearch:9200"},
 }
+# Search backend ("elasticsearch" or "postgres") and the one used when the
+# primary fails its health check. Small deployments can run Postgres only.
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "elasticsearch")
+SEARCH_FALLBACK_BACKEND = os.getenv("SEARCH_FALLBACK_BACKEND", "postgres")
+# Seconds a health check result is reused, and the ping timeout.
+SEARCH_HEALTH_CHECK_INTERVAL = int(os.getenv("SEARCH_HEALTH_CHECK_INTERVAL", 10))
+SEARCH_HEALTH_CHECK_TIMEOUT = float(os.getenv("SEARCH_HEALTH_CHECK_TIMEOUT", 1))
+# Without Elasticsearch as the primary there is nothing to keep in sync.
+ELASTICSEARCH_DSL_AUTOSYNC = SEARCH_BACKEND == "elasticsearch"
+
+# Saves only mark rows dirty; a Celery worker indexes them in bulk.
+ELASTICSEARCH_DSL_SIGNAL_PROCESSOR = "search.signals.QueuedSignalProcessor"
+# Seconds edits are coalesced before a flush, and rows per _bulk request.
+SEARCH_INDEX_FLUSH_INTERVAL = float(os.getenv("SEARCH_INDEX_FLUSH_INTERVAL", 2))
+SEARCH_INDEX_BATCH_SIZE = int(os.getenv("SEARCH_INDEX_BATCH_SIZE", 500))
+
+# Rows inserted per bulk_create by job imports, and rows accepted per request.
+JOB_IMPORT_BATCH_SIZE = int(os.getenv("JOB_IMPORT_BATCH_SIZE", 500))
+JOB_IMPORT_MAX_ROWS = int(os.getenv("JOB_IMPORT_MAX_ROWS", 10000))
+
+# Idempotency-Key: how long a stored response is replayed, and how long a
+# key stays claimed by a request that never finished.
+IDEMPOTENCY_KEY_TIMEOUT = int(os.getenv("IDEMPOTENCY_KEY_TIMEOUT", 24 * 60 * 60))
+IDEMPOTENCY_LOCK_TIMEOUT = int(os.getenv("IDEMPOTENCY_LOCK_TIMEOUT", 60))
+
+# Applications per UPDATE in bulk status changes.
+APPLICATION_BULK_BATCH_SIZE = int(os.getenv("APPLICATION_BULK_BATCH_SIZE", 500))
+
+# Rows fetched per server-side cursor round-trip by the streaming exports.
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", 2000))
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    # Only views that set a throttle_scope are limited, see THROTTLE_RATES.
+    "DEFAULT_THROTTLE_CLASSES": ("jobseeker.throttling.TokenBucketThrottle",),
+    # Reverse proxies in front of the app. Throttles key anonymous clients
+    # on the address the last of them saw in X-Forwarded-For, or on
+    # REMOTE_ADDR with none; client-supplied entries are never trusted.
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", 0)),
     "EXCEPTION_HANDLER": "rest_framework.views.exception_handler",
 }
 
+# Token-bucket rates by throttle_scope ("requests/period", the whole rate
+# may be used as a burst). "scope:role" overrides the rate for users of
+# that role.
+THROTTLE_RATES = {
+    "search": os.getenv("SEARCH_THROTTLE_RATE", "60/min"),
+    "search:recruiter": os.getenv("RECRUITER_SEARCH_THROTTLE_RATE", "300/min"),
+    "suggest": os.getenv("SUGGEST_THROTTLE_RATE", "300/min"),
+    "signup": os.getenv("SIGNUP_THROTTLE_RATE", "10/hour"),
+    "token": os.getenv("TOKEN_THROTTLE_RATE", "20/min"),
+}
+
 # Set time for JWT token expiration
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
+    # Put the user's role etc. in the tokens, so requests need no user query.
+    "TOKEN_OBTAIN_SERIALIZER": "accounts.serializers.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "accounts.serializers.ClaimsTokenRefreshSerializer",
 }
+# Seconds a user loaded for a token without claims is reused.
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv("AUTH_USER_CACHE_TIMEOUT", 60))
 
 AUTH_USER_MODEL = "accounts.CustomUser"
 
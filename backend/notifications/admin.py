@@ -0,0 +1,14 @@
+from django.contrib import admin
+from .models import DigestItem, OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ["id", "kind", "status", "attempts", "next_attempt_at"]
+    list_filter = ["kind", "status"]
+
+
+@admin.register(DigestItem)
+class DigestItemAdmin(admin.ModelAdmin):
+    list_display = ["id", "recipient", "subject", "created_at"]
+    list_select_related = ["recipient"]
@@ -0,0 +1,67 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from .models import DigestItem
+from .outbox import email_payload, enqueue_email, enqueue_many
+
+
+def notify(user, subject, message):
+    """
+    Tell ``user`` about ``message``: by email through the outbox right
+    away, or in the next digest if the user chose digest mode. Like the
+    outbox, call it inside the transaction that makes the change.
+    """
+    if user.notification_mode == "digest":
+        return DigestItem.objects.create(
+            recipient=user, subject=subject, message=message
+        )
+    return enqueue_email(subject, f"Hello,\n\n{message}", [user.email])
+
+
+def digest_payload(recipient, items):
+    """One email listing ``items``, grouped by subject in order of arrival."""
+    sections = defaultdict(list)
+    for item in items:
+        sections[item.subject].append(item.message)
+    body = [
+        f"Hello {recipient.username},",
+        "Here is what happened since your last digest:",
+    ]
+    for subject, messages in sections.items():
+        lines = "\n".join(f"- {message}" for message in messages)
+        body.append(f"{subject} ({len(messages)})\n{lines}")
+    noun = "notification" if len(items) == 1 else "notifications"
+    return email_payload(
+        f"Your JobSeeker digest: {len(items)} {noun}",
+        "\n\n".join(body),
+        [recipient.email],
+    )
+
+
+def send_digests():
+    """
+    Turn every user's buffered items into one outbox email, so a busy
+    recruiter gets one message per interval instead of one per event.
+    The outbox then delivers them all over a single SMTP connection.
+    Return the number of digests queued.
+    """
+    with transaction.atomic():
+        # Skip rows another worker is already bundling.
+        items = list(
+            DigestItem.objects.select_for_update(skip_locked=True, of=("self",))
+            .select_related("recipient")
+            .order_by("created_at", "id")
+        )
+        by_recipient = defaultdict(list)
+        for item in items:
+            by_recipient[item.recipient].append(item)
+        enqueue_many(
+            "email",
+            [
+                digest_payload(recipient, recipient_items)
+                for recipient, recipient_items in by_recipient.items()
+            ],
+        )
+        DigestItem.objects.filter(pk__in=[item.pk for item in items]).delete()
+    return len(by_recipient)
@@ -0,0 +1,131 @@
+import datetime
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_drain():
+    from .tasks import drain_outbox
+
+    drain_outbox.delay()
+
+
+def enqueue(kind, payload):
+    """
+    Record a side effect. Call it inside the transaction that makes the
+    change, so both are committed or rolled back together. A drain is
+    requested after the commit; if the broker is unreachable, the periodic
+    sweep picks the message up instead.
+    """
+    message = OutboxMessage.objects.create(kind=kind, payload=payload)
+    transaction.on_commit(schedule_drain, robust=True)
+    return message
+
+
+def enqueue_many(kind, payloads):
+    """Like ``enqueue`` for many messages, with a single INSERT."""
+    messages = OutboxMessage.objects.bulk_create(
+        [OutboxMessage(kind=kind, payload=payload) for payload in payloads]
+    )
+    if messages:
+        transaction.on_commit(schedule_drain, robust=True)
+    return messages
+
+
+def email_payload(subject, body, to, from_email=None):
+    return {
+        "subject": subject,
+        "body": body,
+        "from_email": from_email or settings.DEFAULT_FROM_EMAIL,
+        "to": list(to),
+    }
+
+
+def enqueue_email(subject, body, to, from_email=None):
+    return enqueue("email", email_payload(subject, body, to, from_email))
+
+
+def send_emails(messages):
+    """Send ``messages`` over one SMTP connection; return errors by pk."""
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as exc:
+        return {message.pk: exc for message in messages}
+    errors = {}
+    try:
+        for message in messages:
+            try:
+                EmailMessage(connection=connection, **message.payload).send()
+            except Exception as exc:
+                errors[message.pk] = exc
+    finally:
+        connection.close()
+    return errors
+
+
+# Message kind -> function delivering a batch of them, returning errors by pk.
+HANDLERS = {"email": send_emails}
+
+
+def retry_delay(attempts):
+    """Exponential backoff after the ``attempts``-th failure, capped."""
+    delay = settings.OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    return datetime.timedelta(seconds=min(delay, settings.OUTBOX_MAX_RETRY_DELAY))
+
+
+def drain_batch(batch_size):
+    """Try up to ``batch_size`` due messages; return how many were tried."""
+    with transaction.atomic():
+        # Locked rows are skipped, so concurrent workers never deliver the
+        # same message twice.
+        messages = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", next_attempt_at__lte=timezone.now())
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        for kind in {message.kind for message in messages}:
+            batch = [message for message in messages if message.kind == kind]
+            record_results(batch, HANDLERS[kind](batch))
+        OutboxMessage.objects.bulk_update(
+            messages,
+            ["status", "attempts", "next_attempt_at", "last_error", "sent_at"],
+        )
+    return len(messages)
+
+
+def record_results(messages, errors):
+    now = timezone.now()
+    for message in messages:
+        message.attempts += 1
+        error = errors.get(message.pk)
+        if error is None:
+            message.status = "sent"
+            message.sent_at = now
+            message.last_error = ""
+            continue
+        message.last_error = repr(error)
+        if message.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            message.status = "failed"
+            logger.error("Giving up on outbox message %s: %r", message.pk, error)
+        else:
+            message.next_attempt_at = now + retry_delay(message.attempts)
+            logger.warning("Outbox message %s failed: %r", message.pk, error)
+
+
+def drain(batch_size=None):
+    """Handle every due message, one locked batch at a time."""
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    handled = 0
+    while True:
+        count = drain_batch(batch_size)
+        handled += count
+        if count < batch_size:
+            return handled
@@ -0,0 +1,14 @@
+from celery import shared_task
+
+from .digests import send_digests
+from .outbox import drain
+
+
+@shared_task(ignore_result=True)
+def drain_outbox():
+    return drain()
+
+
+@shared_task(ignore_result=True)
+def send_notification_digests():
+    return send_digests()
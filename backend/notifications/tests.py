@@ -0,0 +1,139 @@
+import smtplib
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.utils import timezone
+
+from .digests import notify, send_digests
+from .models import DigestItem, OutboxMessage
+from .outbox import drain, enqueue_email
+
+pytestmark = pytest.mark.django_db
+
+
+def test_enqueue_schedules_drain_after_commit(
+    mocker, django_capture_on_commit_callbacks
+):
+    delay = mocker.patch("notifications.tasks.drain_outbox.delay")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        message = enqueue_email("Hi", "Body", ["to@example.com"])
+
+    assert message.status == "pending"
+    assert message.payload["to"] == ["to@example.com"]
+    delay.assert_called_once_with()
+    assert len(mail.outbox) == 0
+
+
+def test_drain_sends_over_one_connection(mocker):
+    for number in range(3):
+        enqueue_email(f"Hi {number}", "Body", [f"user{number}@example.com"])
+    get_connection = mocker.patch(
+        "notifications.outbox.get_connection", wraps=mail.get_connection
+    )
+
+    assert drain() == 3
+
+    assert get_connection.call_count == 1
+    assert sorted(message.subject for message in mail.outbox) == [
+        "Hi 0",
+        "Hi 1",
+        "Hi 2",
+    ]
+    assert not OutboxMessage.objects.exclude(status="sent").exists()
+    assert drain() == 0
+
+
+def test_failed_delivery_is_retried_with_backoff(settings, mocker):
+    settings.OUTBOX_RETRY_DELAY = 30
+    settings.OUTBOX_MAX_ATTEMPTS = 2
+    message = enqueue_email("Hi", "Body", ["to@example.com"])
+    send = mocker.patch(
+        "notifications.outbox.EmailMessage.send",
+        side_effect=smtplib.SMTPServerDisconnected("down"),
+    )
+
+    drain()
+    message.refresh_from_db()
+    assert message.status == "pending"
+    assert message.attempts == 1
+    assert "down" in message.last_error
+    assert message.next_attempt_at > timezone.now() + timedelta(seconds=25)
+
+    # Not due yet: nothing is attempted.
+    assert drain() == 0
+    assert send.call_count == 1
+
+    OutboxMessage.objects.update(next_attempt_at=timezone.now())
+    drain()
+    message.refresh_from_db()
+    assert message.status == "failed"
+    assert message.attempts == 2
+
+
+def test_unreachable_server_fails_the_whole_batch(mocker):
+    enqueue_email("Hi", "Body", ["a@example.com"])
+    enqueue_email("Hi", "Body", ["b@example.com"])
+    connection = mocker.patch("notifications.outbox.get_connection").return_value
+    connection.open.side_effect = OSError("connection refused")
+
+    assert drain() == 2
+
+    assert set(OutboxMessage.objects.values_list("attempts", flat=True)) == {1}
+    assert not OutboxMessage.objects.filter(status="sent").exists()
+
+
+def test_notify_respects_notification_mode():
+    User = get_user_model()
+    immediate = User.objects.create_user(
+        username="now", email="now@example.com", password="password123"
+    )
+    digest = User.objects.create_user(
+        username="later",
+        email="later@example.com",
+        password="password123",
+        notification_mode="digest",
+    )
+
+    notify(immediate, "Hi", "Something happened.")
+    notify(digest, "Hi", "Something happened.")
+
+    message = OutboxMessage.objects.get()
+    assert message.payload["to"] == ["now@example.com"]
+    assert message.payload["body"] == "Hello,\n\nSomething happened."
+    assert DigestItem.objects.get().recipient == digest
+
+
+def test_digests_bundle_items_per_recipient(mocker):
+    User = get_user_model()
+    alice, bob = [
+        User.objects.create_user(
+            username=name,
+            email=f"{name}@example.com",
+            password="password123",
+            notification_mode="digest",
+        )
+        for name in ("alice", "bob")
+    ]
+    for number in range(3):
+        notify(alice, "New Job Application Received", f"Seeker {number} applied.")
+    notify(alice, "Interview", "Tomorrow at 10.")
+    notify(bob, "New Job Application Received", "Seeker 9 applied.")
+    get_connection = mocker.patch(
+        "notifications.outbox.get_connection", wraps=mail.get_connection
+    )
+
+    assert send_digests() == 2
+    assert not DigestItem.objects.exists()
+    assert drain() == 2
+
+    assert get_connection.call_count == 1
+    sent = {message.to[0]: message for message in mail.outbox}
+    assert sent["alice@example.com"].subject == "Your JobSeeker digest: 4 notifications"
+    body = sent["alice@example.com"].body
+    assert "New Job Application Received (3)\n- Seeker 0 applied." in body
+    assert "Interview (1)\n- Tomorrow at 10." in body
+    assert sent["bob@example.com"].subject == "Your JobSeeker digest: 1 notification"
+    assert send_digests() == 0
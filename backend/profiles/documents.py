@@ -20,3 +20,6 @@ class ProfileDocument(Document):
             "id",
             "bio",
         ]
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("user")
@@ -12,6 +12,8 @@ class Profile(models.Model):
     skills = models.TextField(blank=True, help_text="Comma-separated skills")
     contact = models.CharField(max_length=255, blank=True)
     resume = models.FileField(upload_to="resumes/", null=True, blank=True)
+    # Row version for ETag / Last-Modified on the profile endpoints.
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
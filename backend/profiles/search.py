@@ -0,0 +1,59 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django_elasticsearch_dsl.search import Search
+
+from search.backends import ElasticsearchBackend, PostgresBackend
+from .models import Profile
+
+PROFILE_INDEX = "profiles"
+SEARCH_FIELDS = ["bio", "user.username", "user.email"]
+RESULT_SIZE = 10
+
+
+def search_profiles(query):
+    s = Search(index=PROFILE_INDEX).query(
+        "multi_match", query=query, fields=SEARCH_FIELDS
+    )
+    response = s.execute()
+    return [
+        {
+            "id": hit.id,
+            "bio": hit.bio,
+            "username": hit.user.username,
+            "email": hit.user.email,
+        }
+        for hit in response
+    ]
+
+
+class ProfileElasticsearchBackend(ElasticsearchBackend):
+    def search(self, params):
+        return search_profiles(params["q"])
+
+
+class ProfilePostgresBackend(PostgresBackend):
+    """Ranks profiles on a vector computed per query; profiles are few."""
+
+    def search(self, params):
+        vector = SearchVector("bio", "user__username", "user__email")
+        query = SearchQuery(params["q"], search_type="websearch")
+        profiles = (
+            Profile.objects.select_related("user")
+            .annotate(search=vector, rank=SearchRank(vector, query))
+            .filter(search=query)
+            .order_by("-rank", "id")[:RESULT_SIZE]
+        )
+        return [
+            {
+                "id": str(profile.id),
+                "bio": profile.bio,
+                "username": profile.user.username,
+                "email": profile.user.email,
+            }
+            for profile in profiles
+        ]
+
+
+PROFILE_SEARCH_BACKENDS = {
+    ProfileElasticsearchBackend.name: ProfileElasticsearchBackend,
+    ProfilePostgresBackend.name: ProfilePostgresBackend,
+}
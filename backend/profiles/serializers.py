@@ -14,8 +14,9 @@ class ProfileSerializer(serializers.ModelSerializer):
             "resume",
             "location",
             "birth_date",
+            "updated_at",
         ]
-        read_only_fields = ["id", "user"]
+        read_only_fields = ["id", "user", "updated_at"]
 
     def validate(self, attrs):
         for field in ["bio", "skills", "contact", "location"]:
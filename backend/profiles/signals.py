@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from search.cache import bump_generation
+from .models import Profile
+from .search import PROFILE_INDEX
+
+
+@receiver([post_save, post_delete], sender=Profile)
+def invalidate_profile_search_cache(sender, **kwargs):
+    transaction.on_commit(lambda: bump_generation(PROFILE_INDEX))
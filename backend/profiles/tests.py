@@ -118,6 +118,20 @@ class TestMyProfileView:
         seeker_user.profile.refresh_from_db()
         seeker_user.profile.resume.delete(save=True)
 
+    def test_my_profile_conditional_get(self, api_client, seeker_user):
+        """An unchanged profile is answered with 304 until it is updated."""
+        api_client.force_authenticate(user=seeker_user)
+        url = reverse("my-profile")
+        etag = api_client.get(url)["ETag"]
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        api_client.patch(url, {"bio": "Changed."})
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["bio"] == "Changed."
+
 
 # --- View Tests: ProfileListCreateView & ProfileDetailView ---
 
@@ -172,8 +186,9 @@ class TestProfileAccess:
 # --- Search View Test with Mocking ---
 
 
-def test_profile_search_view(api_client, mocker):
+def test_profile_search_view(api_client, mocker, seeker_user):
     """Test the profile search view by mocking the Elasticsearch Search object."""
+    api_client.force_authenticate(user=seeker_user)
     url = reverse("profile-search")
 
     mock_user_data = MagicMock()
@@ -185,7 +200,7 @@ def test_profile_search_view(api_client, mocker):
     mock_hit.bio = "Bio of a mocked user"
     mock_hit.user = mock_user_data
 
-    mock_search = mocker.patch("profiles.views.Search")
+    mock_search = mocker.patch("profiles.search.Search")
     mock_search.return_value.query.return_value.execute.return_value = [mock_hit]
 
     response = api_client.get(url, {"q": "mock"})
@@ -194,3 +209,40 @@ def test_profile_search_view(api_client, mocker):
     assert len(response.data) == 1
     assert response.data[0]["bio"] == "Bio of a mocked user"
     assert response.data[0]["username"] == "mockuser"
+
+
+def test_profile_search_view_is_cached(api_client, mocker, seeker_user):
+    """Repeating a search with equivalent terms is served from the cache."""
+    api_client.force_authenticate(user=seeker_user)
+    url = reverse("profile-search")
+
+    mock_search = mocker.patch("profiles.search.Search")
+    mock_search.return_value.query.return_value.execute.return_value = []
+
+    response = api_client.get(url, {"q": "python remote"})
+    assert response.status_code == status.HTTP_200_OK
+    response = api_client.get(url, {"q": "  Python   Remote "})
+    assert response.status_code == status.HTTP_200_OK
+
+    assert mock_search.return_value.query.return_value.execute.call_count == 1
+
+
+def test_profile_save_invalidates_search_cache(
+    api_client, mocker, seeker_user, django_capture_on_commit_callbacks
+):
+    """Saving a profile bumps the index generation so searches rerun."""
+    api_client.force_authenticate(user=seeker_user)
+    url = reverse("profile-search")
+
+    mock_search = mocker.patch("profiles.search.Search")
+    execute = mock_search.return_value.query.return_value.execute
+    execute.return_value = []
+
+    response = api_client.get(url, {"q": "python"})
+    assert response.status_code == status.HTTP_200_OK
+    with django_capture_on_commit_callbacks(execute=True):
+        Profile.objects.create(user=seeker_user, bio="Python developer")
+    response = api_client.get(url, {"q": "python"})
+    assert response.status_code == status.HTTP_200_OK
+
+    assert execute.call_count == 2
@@ -1,8 +1,10 @@
 from rest_framework import generics, permissions
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django_elasticsearch_dsl.search import Search
+from jobseeker.conditional import ConditionalRetrieveMixin
+from search.backends import run_search
 from .models import Profile
+from .search import PROFILE_INDEX, PROFILE_SEARCH_BACKENDS
 from .serializers import ProfileSerializer
 
 
@@ -17,7 +19,9 @@ class ProfileListCreateView(generics.ListCreateAPIView):
         serializer.save(user=self.request.user)
 
 
-class ProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ProfileDetailView(
+    ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView
+):
     serializer_class = ProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -26,26 +30,15 @@ class ProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 
 class ProfileSearchView(APIView):
+    throttle_scope = "search"
 
     def get(self, request):
         query = request.query_params.get("q", "")
-        s = Search(index="profiles").query(
-            "multi_match", query=query, fields=["bio", "user.username", "user.email"]
-        )
-        response = s.execute()
-        results = [
-            {
-                "id": hit.id,
-                "bio": hit.bio,
-                "username": hit.user.username,
-                "email": hit.user.email,
-            }
-            for hit in response
-        ]
+        results = run_search(PROFILE_INDEX, PROFILE_SEARCH_BACKENDS, {"q": query})
         return Response(results)
 
 
-class MyProfileView(generics.RetrieveUpdateAPIView):
+class MyProfileView(ConditionalRetrieveMixin, generics.RetrieveUpdateAPIView):
     serializer_class = ProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -0,0 +1,131 @@
+from django.conf import settings
+from django.core.cache import cache
+from elastic_transport import TransportError
+from elasticsearch import ApiError
+from elasticsearch_dsl.connections import connections
+from rest_framework.exceptions import ValidationError
+
+from .cache import cached_search
+
+ELASTICSEARCH_HEALTH_KEY = "search:elasticsearch:healthy"
+
+
+class SearchBackend:
+    """
+    One way of answering searches on an index. Subclasses implement
+    ``search(params)`` for validated query parameters and return the
+    same cacheable payload whichever engine runs it.
+    """
+
+    name = None
+    # Errors on which the search is retried on the fallback backend.
+    unavailable_errors = ()
+
+    def is_available(self):
+        return True
+
+    def mark_unavailable(self, error):
+        """Record that ``error`` (one of ``unavailable_errors``) was raised."""
+
+    def search(self, params):
+        raise NotImplementedError
+
+    def make_cursor(self, values):
+        """A next-page cursor tagged with the backend that can resume it."""
+        if values is None:
+            return None
+        return {"backend": self.name, "values": values}
+
+    def cursor_values(self, cursor):
+        """
+        The position stored in ``cursor``. Positions are engine specific, so
+        a cursor issued by another backend (e.g. by the fallback while the
+        primary was down) is a validation error rather than a failed query.
+        """
+        if cursor is None:
+            return None
+        if cursor["backend"] != self.name:
+            raise ValidationError(
+                {"cursor": "This cursor has expired; start from the first page."}
+            )
+        return cursor["values"]
+
+
+class ElasticsearchBackend(SearchBackend):
+    name = "elasticsearch"
+    # Connection failures and timeouts, and error responses from a cluster
+    # that passed the health check (e.g. shard failures, 429, 503).
+    unavailable_errors = (TransportError, ApiError)
+
+    def is_available(self):
+        healthy = cache.get(ELASTICSEARCH_HEALTH_KEY)
+        if healthy is None:
+            client = connections.get_connection().options(
+                request_timeout=settings.SEARCH_HEALTH_CHECK_TIMEOUT
+            )
+            healthy = client.ping()
+            cache.set(
+                ELASTICSEARCH_HEALTH_KEY, healthy, settings.SEARCH_HEALTH_CHECK_INTERVAL
+            )
+        return healthy
+
+    def mark_unavailable(self, error):
+        # A 4xx other than 429 is about this query, not the cluster: fall
+        # back for it alone instead of routing every search away.
+        status = error.meta.status if isinstance(error, ApiError) else None
+        if status is not None and status < 500 and status != 429:
+            return
+        cache.set(
+            ELASTICSEARCH_HEALTH_KEY, False, settings.SEARCH_HEALTH_CHECK_INTERVAL
+        )
+
+
+class PostgresBackend(SearchBackend):
+    name = "postgres"
+
+
+def candidate_backends(backends):
+    """
+    Yield the configured backend when it is healthy, then the fallback.
+    ``backends`` maps backend names to ``SearchBackend`` subclasses.
+    """
+    primary = backends[settings.SEARCH_BACKEND]()
+    fallback = settings.SEARCH_FALLBACK_BACKEND
+    has_fallback = bool(fallback) and fallback != primary.name
+    # Without a fallback the primary is tried anyway and reports its error.
+    if not has_fallback or primary.is_available():
+        yield primary
+    if has_fallback:
+        yield backends[fallback]()
+
+
+def with_fallback(backends, call):
+    """
+    ``call(backend)`` on the first usable backend. When a backend fails
+    with one of its ``unavailable_errors`` it is told so (and may mark
+    itself down), and the next candidate is tried.
+    """
+    candidates = list(candidate_backends(backends))
+    for position, backend in enumerate(candidates):
+        try:
+            return call(backend)
+        except backend.unavailable_errors as exc:
+            backend.mark_unavailable(exc)
+            if position == len(candidates) - 1:
+                raise
+
+
+def run_search(
+    index, backends, params, method="search", prefix="results", timeout=None
+):
+    """Cached ``method(params)`` on the first usable backend."""
+    return with_fallback(
+        backends,
+        lambda backend: cached_search(
+            index,
+            params,
+            lambda: getattr(backend, method)(params),
+            prefix=f"{prefix}:{backend.name}",
+            timeout=timeout,
+        ),
+    )
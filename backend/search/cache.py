@@ -0,0 +1,70 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def generation_key(index):
+    return f"search:{index}:generation"
+
+
+def get_generation(index):
+    """
+    Return the current generation of ``index``. Every cached result embeds
+    it in its key, so bumping it orphans all earlier entries at once.
+    """
+    key = generation_key(index)
+    generation = cache.get(key)
+    if generation is None:
+        # Seed from the clock so an evicted counter never reuses a value.
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(index):
+    key = generation_key(index)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def normalize_params(params):
+    """Drop empty values and fold case/whitespace of the free-text query."""
+    normalized = {}
+    for name, value in params.items():
+        if value in (None, "", []):
+            continue
+        if name == "q":
+            value = " ".join(value.lower().split())
+        normalized[name] = value
+    return normalized
+
+
+def make_key(index, params, prefix="results", versioned=True):
+    """
+    Cache key for ``params`` on ``index``. Unversioned keys survive index
+    changes and only expire, for data that may lag a little.
+    """
+    payload = json.dumps(normalize_params(params), sort_keys=True, default=str)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    generation = get_generation(index) if versioned else "static"
+    return f"search:{index}:{prefix}:{generation}:{digest}"
+
+
+def cached_search(index, params, compute, prefix="results", timeout=None):
+    """
+    Return the cached result of ``compute()`` for ``params`` on ``index``,
+    running and caching it on a miss.
+    """
+    key = make_key(index, params, prefix=prefix)
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        if timeout is None:
+            timeout = settings.SEARCH_CACHE_TIMEOUT
+        cache.set(key, result, timeout)
+    return result
@@ -0,0 +1,149 @@
+import math
+
+from django.conf import settings
+from django.utils import timezone
+from django_elasticsearch_dsl.registries import registry
+
+from jobseeker.redis_client import get_redis_client
+from .cache import bump_generation
+
+FLUSH_SCHEDULED_KEY = "search:index-queue:scheduled"
+
+
+def queue_key(model):
+    return f"search:index-queue:{model._meta.label_lower}"
+
+
+def reindex_target_key(alias):
+    return f"search:reindex-target:{alias}"
+
+
+def set_reindex_target(alias, index_name):
+    """
+    While ``index_name`` is being built for ``alias``, queued edits are
+    written to it as well, so none are lost when the alias is swapped.
+    """
+    get_redis_client().set(reindex_target_key(alias), index_name)
+
+
+def clear_reindex_target(alias):
+    get_redis_client().delete(reindex_target_key(alias))
+
+
+def get_reindex_target(alias):
+    target = get_redis_client().get(reindex_target_key(alias))
+    return target.decode() if target else None
+
+
+def enqueue(model, pk):
+    enqueue_many(model, [pk])
+
+
+def enqueue_many(model, pks):
+    """
+    Mark ``pks`` dirty. The queue is a Redis set, so repeated edits of the
+    same row within one flush window collapse into a single bulk action.
+    """
+    pks = [str(pk) for pk in pks]
+    if not pks:
+        return
+    client = get_redis_client()
+    client.sadd(queue_key(model), *pks)
+    interval = settings.SEARCH_INDEX_FLUSH_INTERVAL
+    # Only the first edit of a window schedules the flush; the key's TTL is
+    # a safety net in case the scheduled task is lost.
+    if client.set(FLUSH_SCHEDULED_KEY, 1, nx=True, ex=math.ceil(interval) * 10):
+        from .tasks import flush_index_queue
+
+        flush_index_queue.apply_async(countdown=interval)
+
+
+def version_of(moment):
+    """An external document version: the timestamp in microseconds."""
+    return int(moment.timestamp() * 1_000_000)
+
+
+def index_actions(document, rows):
+    """
+    ``index`` actions carrying the row's ``updated_at`` as an external
+    version. The queue and a reindex's bulk load both write to the new
+    index, and with versions the older copy of a row loses whichever
+    arrives last.
+    """
+    for row in rows:
+        if document.should_index_object(row):
+            action = document._prepare_action(row, "index")
+            action["_version"] = version_of(row.updated_at)
+            action["_version_type"] = "external_gte"
+            yield action
+
+
+def build_actions(document, pks):
+    """
+    ``index`` actions for rows that still exist and ``delete`` actions for
+    the ones that are gone, so saves and deletes share one queue.
+    """
+    rows = list(document.get_queryset().filter(pk__in=pks))
+    actions = list(index_actions(document, rows))
+    found = {str(document.generate_id(row)) for row in rows}
+    # Versioned "now", so a copy of the row read before the delete cannot
+    # bring the document back.
+    deleted_version = version_of(timezone.now())
+    actions.extend(
+        {
+            "_op_type": "delete",
+            "_index": document._index._name,
+            "_id": pk,
+            "_version": deleted_version,
+            "_version_type": "external_gte",
+        }
+        for pk in pks
+        if pk not in found
+    )
+    return actions
+
+
+def flush_model(model, batch_size=None):
+    """Drain the queue of ``model`` into ES, one ``_bulk`` request per batch."""
+    client = get_redis_client()
+    key = queue_key(model)
+    batch_size = batch_size or settings.SEARCH_INDEX_BATCH_SIZE
+    documents = [
+        document()
+        for document in registry.get_documents([model])
+        if not document.django.ignore_signals
+    ]
+    flushed = 0
+    while True:
+        pks = [pk.decode() for pk in client.spop(key, batch_size)]
+        if not pks:
+            break
+        try:
+            for document in documents:
+                actions = build_actions(document, pks)
+                target = get_reindex_target(document._index._name)
+                if target:
+                    actions += [{**action, "_index": target} for action in actions]
+                # Missing ids on delete are expected: the row may never have
+                # reached the index before it was removed. Version conflicts
+                # mean a newer copy is already there.
+                document.bulk(actions, ignore_status=(404, 409))
+        except Exception:
+            # Put the batch back so the next flush retries it.
+            client.sadd(key, *pks)
+            raise
+        flushed += len(pks)
+
+    if flushed:
+        for document in documents:
+            bump_generation(document._index._name)
+    return flushed
+
+
+def flush_all(batch_size=None):
+    # Clear the flag first: edits arriving from now on schedule a new flush.
+    get_redis_client().delete(FLUSH_SCHEDULED_KEY)
+    return {
+        model._meta.label_lower: flush_model(model, batch_size=batch_size)
+        for model in registry.get_models()
+    }
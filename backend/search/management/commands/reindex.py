@@ -0,0 +1,161 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django_elasticsearch_dsl.registries import registry
+from elasticsearch.helpers import bulk
+
+from search.cache import bump_generation
+from search.indexing import clear_reindex_target, index_actions, set_reindex_target
+
+# Applied while loading: no periodic refreshes and no replica copies, and
+# delete tombstones kept for the whole load, so a row read before it was
+# deleted cannot bring its document back.
+BULK_LOAD_SETTINGS = {
+    "refresh_interval": "-1",
+    "number_of_replicas": 0,
+    "gc_deletes": "12h",
+}
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild search indices into new versioned indices (e.g. jobs_v3) and "
+        "atomically point the index alias at them, without search downtime."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--index",
+            nargs="*",
+            dest="indices",
+            help="Aliases to rebuild (default: all registered indices).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of parallel bulk requests.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Rows fetched per database round-trip and sent per bulk request.",
+        )
+        parser.add_argument(
+            "--keep-old",
+            action="store_true",
+            help="Keep the previous versioned indices instead of deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        documents = {
+            document._index._name: document for document in registry.get_documents()
+        }
+        aliases = options["indices"] or sorted(documents)
+        unknown = set(aliases) - set(documents)
+        if unknown:
+            raise CommandError(f"Unknown index: {', '.join(sorted(unknown))}")
+
+        for alias in aliases:
+            self.reindex(documents[alias](), options)
+
+    def reindex(self, document, options):
+        client = document._get_connection()
+        alias = document._index._name
+        new_index = f"{alias}_v{self.next_version(client, alias)}"
+
+        self.stdout.write(f"Building {new_index} for alias '{alias}'...")
+        index = document._index.clone(name=new_index)
+        index.settings(**BULK_LOAD_SETTINGS)
+        index.create()
+
+        set_reindex_target(alias, new_index)
+        try:
+            indexed = self.load(
+                client, document, new_index, options["workers"], options["chunk_size"]
+            )
+            self.restore_settings(client, document, new_index)
+            client.indices.refresh(index=new_index)
+            old_indices = self.swap_alias(client, alias, new_index)
+        except Exception:
+            client.indices.delete(index=new_index, ignore_unavailable=True)
+            raise
+        finally:
+            clear_reindex_target(alias)
+        bump_generation(alias)
+
+        if old_indices and not options["keep_old"]:
+            client.indices.delete(index=",".join(old_indices), ignore_unavailable=True)
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {indexed} documents into {new_index}.")
+        )
+
+    def next_version(self, client, alias):
+        versions = [
+            int(name.rsplit("_v", 1)[1])
+            for name in client.indices.get(index=f"{alias}_v*")
+            if name.rsplit("_v", 1)[1].isdigit()
+        ]
+        return max(versions, default=0) + 1
+
+    def load(self, client, document, index_name, workers, chunk_size):
+        """
+        Stream rows with a server-side cursor and keep up to ``workers``
+        bulk requests in flight. Rows are read on this thread only. Edits
+        flushed by the queue meanwhile also reach the new index; documents
+        are versioned by ``updated_at``, so the newer copy always wins.
+        """
+        rows = document.get_queryset().iterator(chunk_size=chunk_size)
+        indexed = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            for actions in batched(index_actions(document, rows), chunk_size):
+                for action in actions:
+                    action["_index"] = index_name
+                pending.add(
+                    pool.submit(
+                        bulk,
+                        client,
+                        actions,
+                        chunk_size=chunk_size,
+                        # A newer copy from the queue is already there.
+                        ignore_status=(409,),
+                    )
+                )
+                if len(pending) >= workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    indexed += sum(future.result()[0] for future in done)
+            indexed += sum(future.result()[0] for future in pending)
+        return indexed
+
+    def restore_settings(self, client, document, index_name):
+        # Back to the index definition, or to the ES default (null).
+        defined = document._index._settings
+        client.indices.put_settings(
+            index=index_name,
+            settings={name: defined.get(name) for name in BULK_LOAD_SETTINGS},
+        )
+
+    def swap_alias(self, client, alias, new_index):
+        """Move ``alias`` to ``new_index`` in one atomic request."""
+        actions = [{"add": {"index": new_index, "alias": alias}}]
+        old_indices = []
+        if client.indices.exists_alias(name=alias):
+            old_indices = list(client.indices.get_alias(name=alias))
+            actions += [
+                {"remove": {"index": index, "alias": alias}} for index in old_indices
+            ]
+        elif client.indices.exists(index=alias):
+            # A concrete index from before aliases were used: drop it in the
+            # same request so the alias name becomes free.
+            actions.append({"remove_index": {"index": alias}})
+        client.indices.update_aliases(actions=actions)
+        return old_indices
@@ -0,0 +1,36 @@
+from django.db import models, transaction
+from django_elasticsearch_dsl.apps import DEDConfig
+from django_elasticsearch_dsl.registries import registry
+from django_elasticsearch_dsl.signals import BaseSignalProcessor
+
+from .indexing import enqueue
+
+
+class QueuedSignalProcessor(BaseSignalProcessor):
+    """
+    Record the primary keys of changed documents instead of indexing them
+    inside the request. The Celery ``flush_index_queue`` task sends them to
+    Elasticsearch in coalesced ``_bulk`` requests.
+    """
+
+    def setup(self):
+        models.signals.post_save.connect(self.handle_save)
+        models.signals.post_delete.connect(self.handle_delete)
+
+    def teardown(self):
+        models.signals.post_save.disconnect(self.handle_save)
+        models.signals.post_delete.disconnect(self.handle_delete)
+
+    def handle_save(self, sender, instance, **kwargs):
+        self._enqueue(sender, instance)
+
+    def handle_delete(self, sender, instance, **kwargs):
+        self._enqueue(sender, instance)
+
+    def _enqueue(self, sender, instance):
+        if not DEDConfig.autosync_enabled() or sender not in registry.get_models():
+            return
+        pk = instance.pk
+        # Wait for the commit, or the worker could read the row before it
+        # exists and index nothing.
+        transaction.on_commit(lambda: enqueue(sender, pk))
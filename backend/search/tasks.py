@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from .indexing import flush_all
+
+
+@shared_task(ignore_result=True)
+def flush_index_queue():
+    return flush_all()
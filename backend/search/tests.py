@@ -0,0 +1,276 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from jobs.documents import JobDocument
+from jobs.models import Job
+from search import indexing
+from search.backends import SearchBackend, run_search
+from search.management.commands.reindex import Command as ReindexCommand
+from search.cache import (
+    bump_generation,
+    cached_search,
+    get_generation,
+    make_key,
+    normalize_params,
+)
+
+
+def test_normalize_params_folds_query_and_drops_empty_values():
+    """Equivalent queries normalize to the same parameters."""
+    assert normalize_params(
+        {"q": "  Python   REMOTE ", "location": "", "cursor": None}
+    ) == {"q": "python remote"}
+
+
+def test_make_key_ignores_parameter_order_and_case():
+    first = make_key("jobs", {"q": "Python", "salary_min": Decimal("10.00")})
+    second = make_key("jobs", {"salary_min": Decimal("10.00"), "q": "python"})
+    assert first == second
+
+
+def test_make_key_differs_per_index_and_filters():
+    assert make_key("jobs", {"q": "python"}) != make_key("profiles", {"q": "python"})
+    assert make_key("jobs", {"q": "python"}) != make_key(
+        "jobs", {"q": "python", "location": "Lisbon"}
+    )
+
+
+def test_bump_generation_invalidates_cached_results():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"results": [], "next": None}
+
+    cached_search("jobs", {"q": "python"}, compute)
+    cached_search("jobs", {"q": "python"}, compute)
+    assert len(calls) == 1
+
+    before = get_generation("jobs")
+    bump_generation("jobs")
+    assert get_generation("jobs") != before
+
+    cached_search("jobs", {"q": "python"}, compute)
+    assert len(calls) == 2
+
+
+def test_bump_generation_only_affects_its_index():
+    profiles = get_generation("profiles")
+    bump_generation("jobs")
+    assert get_generation("profiles") == profiles
+
+
+# --- Indexing queue ---
+
+
+@pytest.fixture
+def recruiter_user(db):
+    return get_user_model().objects.create_user(
+        username="recruiter", password="password123", role="recruiter"
+    )
+
+
+def test_enqueue_dedupes_and_schedules_a_single_flush(fake_redis, mocker):
+    """A burst of edits is coalesced into one set and one scheduled flush."""
+    apply_async = mocker.patch("search.tasks.flush_index_queue.apply_async")
+
+    for _ in range(3):
+        indexing.enqueue(Job, "job-1")
+    indexing.enqueue(Job, "job-2")
+
+    assert fake_redis.sets[indexing.queue_key(Job)] == {b"job-1", b"job-2"}
+    apply_async.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_flush_model_sends_batched_bulk_requests(fake_redis, mocker, recruiter_user):
+    """Existing rows are indexed and vanished rows deleted, in batches."""
+    bulk = mocker.patch.object(JobDocument, "bulk")
+    jobs = [
+        Job.objects.create(
+            title=f"Job {i}", description="d", location="l", posted_by=recruiter_user
+        )
+        for i in range(3)
+    ]
+    fake_redis.sadd(
+        indexing.queue_key(Job),
+        *[str(job.pk) for job in jobs],
+        "00000000-0000-0000-0000-000000000000",
+    )
+
+    assert indexing.flush_model(Job, batch_size=2) == 4
+
+    assert bulk.call_count == 2
+    actions = [action for call in bulk.call_args_list for action in call.args[0]]
+    assert sorted(a["_op_type"] for a in actions) == ["delete", "index", "index", "index"]
+    assert not fake_redis.sets[indexing.queue_key(Job)]
+    # Versioned by updated_at; deletes outrank any copy read before them.
+    versions = {job.pk: indexing.version_of(job.updated_at) for job in jobs}
+    for action in actions:
+        assert action["_version_type"] == "external_gte"
+        if action["_op_type"] == "index":
+            assert action["_version"] == versions[action["_id"]]
+        else:
+            assert action["_version"] >= max(versions.values())
+    assert bulk.call_args.kwargs["ignore_status"] == (404, 409)
+
+
+@pytest.mark.django_db
+def test_flush_model_requeues_batch_on_failure(fake_redis, mocker):
+    """If Elasticsearch fails, the popped batch goes back on the queue."""
+    mocker.patch.object(JobDocument, "bulk", side_effect=ConnectionError)
+    fake_redis.sadd(indexing.queue_key(Job), "00000000-0000-0000-0000-000000000000")
+
+    with pytest.raises(ConnectionError):
+        indexing.flush_model(Job)
+
+    assert fake_redis.sets[indexing.queue_key(Job)] == {
+        b"00000000-0000-0000-0000-000000000000"
+    }
+
+
+@pytest.mark.django_db
+def test_job_save_is_queued_on_commit(
+    fake_redis, mocker, recruiter_user, django_capture_on_commit_callbacks
+):
+    """Saving a Job records its pk instead of calling Elasticsearch."""
+    mocker.patch("search.tasks.flush_index_queue.apply_async")
+    bulk = mocker.patch.object(JobDocument, "bulk")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        job = Job.objects.create(
+            title="Queued", description="d", location="l", posted_by=recruiter_user
+        )
+
+    bulk.assert_not_called()
+    assert fake_redis.sets[indexing.queue_key(Job)] == {str(job.pk).encode()}
+
+
+# --- Zero-downtime reindex ---
+
+
+def test_reindex_next_version_follows_existing_indices():
+    client = MagicMock()
+    client.indices.get.return_value = {"jobs_v1": {}, "jobs_v7": {}, "jobs_vold": {}}
+    assert ReindexCommand().next_version(client, "jobs") == 8
+
+    client.indices.get.return_value = {}
+    assert ReindexCommand().next_version(client, "jobs") == 1
+
+
+def test_reindex_swaps_alias_atomically():
+    """The alias moves off every old index in the same update_aliases call."""
+    client = MagicMock()
+    client.indices.exists_alias.return_value = True
+    client.indices.get_alias.return_value = {"jobs_v1": {}}
+
+    old = ReindexCommand().swap_alias(client, "jobs", "jobs_v2")
+
+    assert old == ["jobs_v1"]
+    client.indices.update_aliases.assert_called_once_with(
+        actions=[
+            {"add": {"index": "jobs_v2", "alias": "jobs"}},
+            {"remove": {"index": "jobs_v1", "alias": "jobs"}},
+        ]
+    )
+
+
+def test_reindex_replaces_legacy_concrete_index():
+    """A pre-alias concrete `jobs` index is removed in the swap request."""
+    client = MagicMock()
+    client.indices.exists_alias.return_value = False
+    client.indices.exists.return_value = True
+
+    ReindexCommand().swap_alias(client, "jobs", "jobs_v1")
+
+    client.indices.update_aliases.assert_called_once_with(
+        actions=[
+            {"add": {"index": "jobs_v1", "alias": "jobs"}},
+            {"remove_index": {"index": "jobs"}},
+        ]
+    )
+
+
+@pytest.mark.django_db
+def test_reindex_load_streams_rows_into_new_index(mocker, recruiter_user):
+    bulk = mocker.patch(
+        "search.management.commands.reindex.bulk",
+        side_effect=lambda client, actions, **kwargs: (len(actions), []),
+    )
+    for i in range(5):
+        Job.objects.create(
+            title=f"Job {i}", description="d", location="l", posted_by=recruiter_user
+        )
+
+    indexed = ReindexCommand().load(
+        MagicMock(), JobDocument(), "jobs_v2", workers=2, chunk_size=2
+    )
+
+    assert indexed == 5
+    assert bulk.call_count == 3
+    actions = [action for call in bulk.call_args_list for action in call.args[1]]
+    assert {action["_index"] for action in actions} == {"jobs_v2"}
+    assert all(action["_version_type"] == "external_gte" for action in actions)
+    assert bulk.call_args.kwargs["ignore_status"] == (409,)
+
+
+# --- Backend selection ---
+
+
+class DownError(Exception):
+    pass
+
+
+class PrimaryBackend(SearchBackend):
+    name = "primary"
+    unavailable_errors = (DownError,)
+    available = True
+    fail = False
+
+    def is_available(self):
+        return PrimaryBackend.available
+
+    def search(self, params):
+        if PrimaryBackend.fail:
+            raise DownError
+        return ["primary"]
+
+
+class FallbackBackend(SearchBackend):
+    name = "fallback"
+
+    def search(self, params):
+        return ["fallback"]
+
+
+@pytest.fixture
+def fake_backends(settings):
+    settings.SEARCH_BACKEND = "primary"
+    settings.SEARCH_FALLBACK_BACKEND = "fallback"
+    PrimaryBackend.available = True
+    PrimaryBackend.fail = False
+    return {"primary": PrimaryBackend, "fallback": FallbackBackend}
+
+
+def test_run_search_uses_primary_when_healthy(fake_backends):
+    assert run_search("jobs", fake_backends, {"q": "python"}) == ["primary"]
+
+
+def test_run_search_skips_unhealthy_primary(fake_backends):
+    PrimaryBackend.available = False
+    assert run_search("jobs", fake_backends, {"q": "python"}) == ["fallback"]
+
+
+def test_run_search_falls_back_when_primary_errors(fake_backends):
+    PrimaryBackend.fail = True
+    assert run_search("jobs", fake_backends, {"q": "python"}) == ["fallback"]
+
+
+def test_run_search_without_fallback_raises(fake_backends, settings):
+    settings.SEARCH_FALLBACK_BACKEND = None
+    PrimaryBackend.fail = True
+    with pytest.raises(DownError):
+        run_search("jobs", fake_backends, {"q": "python"})
@@ -1,4 +1,4 @@
-import { useQuery } from '@tanstack/react-query';
+import { useInfiniteQuery } from '@tanstack/react-query';
 import api from '../api/api';
 import { Link } from 'react-router-dom';
 
@@ -9,11 +9,20 @@ interface Job {
   salary: string;
 }
 
+interface JobPage {
+  next: string | null;
+  previous: string | null;
+  results: Job[];
+}
+
 export default function Jobs() {
-  const { data, isLoading, error } = useQuery<Job[]>({
+  const { data, isLoading, error, fetchNextPage, hasNextPage, isFetchingNextPage } = useInfiniteQuery({
     queryKey: ['jobs'],
-    queryFn: async () => (await api.get('jobs/')).data,
+    queryFn: async ({ pageParam }): Promise<JobPage> => (await api.get(pageParam ?? 'jobs/?fields=id,title,location,salary')).data,
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next,
   });
+  const jobs = data?.pages.flatMap(page => page.results) ?? [];
 
   if (isLoading) return <div className="p-4 text-center">Loading jobs...</div>;
   if (error) return <div className="p-4 text-center text-red-500">Failed to load jobs.</div>;
@@ -32,7 +41,7 @@ export default function Jobs() {
         </div>
       </div>
       <ul className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
-        {data?.map(job => (
+        {jobs.map(job => (
           <li key={job.id} className="border p-4 rounded-lg shadow-sm hover:shadow-md transition-shadow duration-300">
             <Link to={`/jobs/${job.id}`} className="block">
               <h3 className="text-xl font-medium text-blue-600">{job.title}</h3>
@@ -42,6 +51,17 @@ export default function Jobs() {
           </li>
         ))}
       </ul>
+      {hasNextPage && (
+        <div className="flex justify-center mt-6">
+          <button
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+            className="bg-blue-500 hover:bg-blue-600 text-white py-2 px-4 rounded disabled:opacity-50"
+          >
+            {isFetchingNextPage ? 'Loading...' : 'Load more'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }